@@ -7,15 +7,38 @@ without polluting the system environment.
 
 from __future__ import annotations
 
+import functools
 import logging
+import os
+import tempfile
 from pathlib import Path
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Tuple
 
 from dotenv import dotenv_values
 
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=64)
+def split_list(raw: str) -> Tuple[str, ...]:
+    """
+    Split a comma-separated value into stripped, non-empty entries.
+    
+    Memoized on the raw string, so repeated reads of an unchanged .env
+    value are parsed only once; a rewritten value is simply a new key.
+    
+    Args:
+        raw: Comma-separated string (may be empty)
+    
+    Returns:
+        Tuple of entries, in order
+        
+    Example:
+        split_list("a, b,,c")  # ("a", "b", "c")
+    """
+    return tuple(item.strip() for item in raw.split(",") if item.strip())
+
+
 class EnvStore:
     """
     Read/write helper for .env key-value pairs.
@@ -76,6 +99,21 @@ class EnvStore:
         """
         return self.read().get(key, default).strip()
 
+    def get_list(self, key: str) -> Tuple[str, ...]:
+        """
+        Get a comma-separated value from .env file as a tuple.
+        
+        Args:
+            key: Environment variable name
+        
+        Returns:
+            Tuple of stripped, non-empty entries (empty if key not found)
+            
+        Example:
+            codes = store.get_list("GALLERY_REGISTRATION_CODES")
+        """
+        return split_list(self.get(key))
+
     def set(self, key: str, value: str) -> None:
         """
         Set or update a key-value pair in .env file.
@@ -121,8 +159,7 @@ class EnvStore:
             out_lines.append(f"{key}={value}")
 
         try:
-            self.env_path.parent.mkdir(parents=True, exist_ok=True)
-            self.env_path.write_text("\n".join(out_lines) + "\n", encoding="utf-8")
+            self._write_lines(out_lines)
             logger.debug(f"Set {key} in {self.env_path}")
         except Exception as e:
             logger.error(f"Failed to write to .env file: {e}")
@@ -155,15 +192,12 @@ class EnvStore:
         
         for line in lines:
             if line.strip() and not line.strip().startswith("#"):
-                # Check if this line starts with any of our keys
-                matched = False
-                for key in values.keys():
-                    if line.startswith(f"{key}="):
-                        out_lines.append(f"{key}={values[key].strip()}")
-                        updated_keys.add(key)
-                        matched = True
-                        break
-                if not matched:
+                # Look the line's key up directly instead of testing every key
+                key = line.split("=", 1)[0] if "=" in line else None
+                if key in values:
+                    out_lines.append(f"{key}={values[key].strip()}")
+                    updated_keys.add(key)
+                else:
                     out_lines.append(line)
             else:
                 out_lines.append(line)
@@ -173,8 +207,7 @@ class EnvStore:
             if key not in updated_keys:
                 out_lines.append(f"{key}={value.strip()}")
 
-        self.env_path.parent.mkdir(parents=True, exist_ok=True)
-        self.env_path.write_text("\n".join(out_lines) + "\n", encoding="utf-8")
+        self._write_lines(out_lines)
         logger.debug(f"Set {len(values)} keys in {self.env_path}")
 
     def delete(self, key: str) -> bool:
@@ -206,7 +239,7 @@ class EnvStore:
                 out_lines.append(line)
 
         if found:
-            self.env_path.write_text("\n".join(out_lines) + "\n", encoding="utf-8")
+            self._write_lines(out_lines)
             logger.debug(f"Deleted {key} from {self.env_path}")
         
         return found
@@ -281,6 +314,29 @@ class EnvStore:
         
         return backup_path
 
+    def _write_lines(self, lines: List[str]) -> None:
+        """
+        Replace the .env file with the given lines atomically.
+        
+        Writes to a temp file in the same directory and swaps it in with
+        os.replace, so a concurrent reader (another xdist worker, or a
+        crash mid-write) never sees a half-written file.
+        
+        Args:
+            lines: File content, one entry per line
+        """
+        self.env_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(
+            dir=self.env_path.parent, prefix=f"{self.env_path.name}.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write("\n".join(lines) + "\n")
+            os.replace(tmp_path, self.env_path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
     def __repr__(self) -> str:
         """String representation of EnvStore."""
         return f"EnvStore(env_path={self.env_path})"
\ No newline at end of file
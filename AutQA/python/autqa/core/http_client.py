@@ -15,6 +15,7 @@ import requests
 
 # Re-use your existing request helpers
 from client import get as _get
+from client import get_session
 from client import post as _post
 
 from autqa.core.config import get_settings
@@ -163,10 +164,12 @@ class HttpClient:
         # Merge auth headers
         headers = self._get_auth_headers(extra_headers)
         
-        logger.debug(
-            f"POST {path} | payload_size={len(str(json)) if json else 0} | "
-            f"with_apikey={with_apikey}"
-        )
+        # str() of an image payload is costly; only build it when it is logged
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"POST {path} | payload_size={len(str(json)) if json else 0} | "
+                f"with_apikey={with_apikey}"
+            )
         
         if retry:
             return self._execute_with_retry(
@@ -274,7 +277,7 @@ class HttpClient:
 
         logger.debug(f"DELETE {path} | params={params} | with_apikey={with_apikey}")
 
-        # Use the requests library directly
+        # Build the request directly on the shared session
         settings = get_settings()
         url = f"{settings.baseurl}{path}"
         
@@ -284,7 +287,7 @@ class HttpClient:
             headers["apikey"] = settings.apikey
 
         def do_delete():
-            return requests.delete(url, params=params, headers=headers, timeout=self.timeout)
+            return get_session().delete(url, params=params, headers=headers, timeout=self.timeout)
 
         if retry:
             return self._execute_with_retry(do_delete, method="DELETE", path=path)
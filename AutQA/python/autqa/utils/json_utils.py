@@ -0,0 +1,127 @@
+"""
+JSON helpers with optional orjson acceleration.
+
+Uses orjson when it is installed (noticeably faster on large OCR and
+liveness payloads) and falls back to the standard library otherwise.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    Parse a JSON document.
+
+    Args:
+        data: JSON text or UTF-8 encoded bytes
+
+    Returns:
+        Parsed Python object
+
+    Example:
+        payload = loads(b'{"status": "OK"}')
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False) -> str:
+    """
+    Serialize an object to a JSON string.
+
+    Falls back to the standard library for objects orjson rejects
+    (e.g. non-string dict keys).
+
+    Args:
+        obj: Object to serialize
+        indent: Pretty-print with 2-space indentation
+
+    Returns:
+        JSON string
+
+    Example:
+        text = dumps({"status": "OK"}, indent=True)
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            option = orjson.OPT_INDENT_2 if indent else 0
+            return orjson.dumps(obj, option=option).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(obj, indent=2 if indent else None)
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """
+    Serialize an object to a UTF-8 encoded JSON request body.
+
+    Skips the str round trip dumps() does, which matters for the
+    multi-megabyte base64 image payloads.
+
+    Args:
+        obj: Object to serialize
+
+    Returns:
+        JSON document as bytes
+
+    Example:
+        body = dumps_bytes({"galleryName": "test_gallery_1a2b3c4d"})
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            pass
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def response_json(response) -> Any:
+    """
+    Parse the body of an HTTP response.
+
+    Reads response.content directly instead of going through
+    response.json(), so orjson is used when available.
+
+    Args:
+        response: requests.Response object
+
+    Returns:
+        Parsed JSON body
+
+    Example:
+        data = response_json(api_client.http_client.get("/path"))
+    """
+    return loads(response.content)
+
+
+def json_or_empty(response) -> Any:
+    """
+    Parse the body of a 200 response, or return an empty dict otherwise.
+
+    Replaces the `resp.json() if resp.status_code == 200 else {}` idiom;
+    the body is only parsed on success. A fresh dict is returned on
+    failure because callers deep-copy and mutate the result.
+
+    Args:
+        response: requests.Response object
+
+    Returns:
+        Parsed JSON body, or {} for non-200 responses
+
+    Example:
+        face_data = json_or_empty(face_response)
+    """
+    if response.status_code != 200:
+        return {}
+    return loads(response.content)
@@ -86,6 +86,47 @@ def setup_logging(
         root_logger.addHandler(file_handler)
 
 
+class LogBuffer:
+    """
+    Collect log lines and emit them as a single record on exit.
+    
+    Saves one handler dispatch (timestamp formatting, stream/file write,
+    caplog capture) per line for sections that log many lines at once.
+    Lines are not collected at all when the level is disabled.
+    
+    Example:
+        with LogBuffer(logger) as out:
+            out.add("RESPONSE SUMMARY")
+            out.add(f"Status: {status}", f"Score: {score}")
+    """
+    
+    def __init__(self, logger: logging.Logger, level: int = logging.INFO):
+        """
+        Initialize the buffer.
+        
+        Args:
+            logger: Logger that receives the combined record
+            level: Level of the combined record
+        """
+        self.logger = logger
+        self.level = level
+        self.enabled = logger.isEnabledFor(level)
+        self.lines: list = []
+    
+    def add(self, *lines: str) -> None:
+        """Append one or more lines to the buffer."""
+        if self.enabled:
+            self.lines.extend(lines)
+    
+    def __enter__(self) -> "LogBuffer":
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        if self.lines:
+            self.logger.log(self.level, "\n".join(self.lines))
+        return False
+
+
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger instance with the given name.
@@ -8,6 +8,16 @@ from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# enrollmentStatus codes returned by the enrollment endpoints, indexed by value
+ENROLLMENT_STATUS_NAMES = ("FAILED", "PENDING", "COMPLETE")
+
+
+def enrollment_status_name(status) -> str:
+    """Map an enrollmentStatus code (0/1/2) to its name, or 'UNKNOWN'"""
+    if isinstance(status, int) and 0 <= status < len(ENROLLMENT_STATUS_NAMES):
+        return ENROLLMENT_STATUS_NAMES[status]
+    return "UNKNOWN"
+
 
 def analyze_ocr_response(doc_data: dict) -> dict:
     """
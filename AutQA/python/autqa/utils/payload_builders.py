@@ -39,6 +39,37 @@ def build_face_frame_object(
     }
 
 
+def normalize_base64(data: Optional[str]) -> Optional[str]:
+    """
+    Strip surrounding whitespace and a data URI prefix from a base64 image.
+    
+    The comma ending a "data:...;base64," header is looked for in the first
+    128 characters, so multi-MB payloads are not scanned; longer headers
+    (e.g. with a name= parameter) fall back to a full search. Whitespace is
+    only stripped when present, so clean values are not copied.
+    
+    Args:
+        data: Base64 string, optionally with a data URI prefix
+    
+    Returns:
+        Bare base64 string (empty or None input is returned unchanged)
+        
+    Example:
+        image = normalize_base64("data:image/jpeg;base64,/9j/4AAQ...")
+    """
+    if not data:
+        return data
+    if data[:1].isspace():
+        data = data.lstrip()
+    if data[:5] == "data:":
+        idx = data.find(",", 5, 128)
+        if idx == -1:
+            idx = data.find(",", 5)
+        if idx != -1:
+            data = data[idx + 1:]
+    return data.rstrip() if data[-1:].isspace() else data
+
+
 def build_face_liveness_payload(
     frames: List[Dict[str, Any]],
     workflow: str = "charlie4",
@@ -57,7 +57,8 @@ def poll_until(
     check_fn: Callable[[], bool],
     timeout: float = 30.0,
     poll_interval: float = 2.0,
-    description: str = "condition"
+    description: str = "condition",
+    max_interval: Optional[float] = None,
 ) -> bool:
     """
     Poll until condition is met or timeout.
@@ -65,8 +66,9 @@ def poll_until(
     Args:
         check_fn: Function that returns True when condition is met
         timeout: Maximum time to wait in seconds
-        poll_interval: Seconds between checks
+        poll_interval: Seconds between checks (the first delay when backing off)
         description: Description of what we're waiting for
+        max_interval: If set, the delay doubles after each check up to this cap
     
     Returns:
         True if condition met, False if timeout
@@ -81,22 +83,26 @@ def poll_until(
     start_time = time.time()
     attempt = 1
     
-    print(f"  ⏱️  Polling for {description} (timeout: {timeout}s)...")
+    logger.info(f"Polling for {description} (timeout: {timeout}s)...")
     
     while time.time() - start_time < timeout:
         try:
             if check_fn():
                 elapsed = time.time() - start_time
-                print(f"  ✓ {description} confirmed after {elapsed:.1f}s")
                 logger.info(f"{description} confirmed after {elapsed:.1f}s")
                 return True
         except Exception as e:
             logger.debug(f"Poll attempt {attempt} failed: {e}")
         
-        time.sleep(poll_interval)
+        if max_interval is None:
+            delay = poll_interval
+        else:
+            delay = progressive_delay(poll_interval, max_interval, attempt)
+        # Don't sleep past the deadline just to give up afterwards
+        remaining = timeout - (time.time() - start_time)
+        time.sleep(max(0.0, min(delay, remaining)))
         attempt += 1
     
     elapsed = time.time() - start_time
-    print(f"  ⚠️  Timeout waiting for {description} after {elapsed:.1f}s")
     logger.warning(f"Timeout waiting for {description} after {elapsed:.1f}s")
-    return False
\ No newline at end of file
+    return False
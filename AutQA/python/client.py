@@ -5,12 +5,19 @@ Handles token caching, header construction, and request execution with
 centralized configuration loading from .env file.
 """
 
+import logging
 import os
 from typing import Optional, Dict, Any
 from urllib.parse import urljoin
 
 import requests
 from dotenv import dotenv_values
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from autqa.utils.json_utils import dumps_bytes
+
+logger = logging.getLogger(__name__)
 
 
 # --- Environment loading ---
@@ -71,6 +78,56 @@ CLIENT_SECRET: Optional[str] = _get_env("CLIENT_SECRET", ("client_secret",))
 REALM: Optional[str] = _get_env("REALM_NAME", ("realm_name",))
 
 
+# --- Connection pooling ---
+_SESSION: Optional[requests.Session] = None
+
+
+def configure_session(session: requests.Session) -> requests.Session:
+    """
+    Apply connection pooling and compression settings to a session.
+    
+    Mounts a pooled HTTPAdapter for http/https and asks the server for
+    compressed responses, so large list payloads transfer fewer bytes.
+    Failed connection attempts are retried inside the adapter with a short
+    backoff; nothing has been sent at that point, so this is safe for POST
+    and cheaper than HttpClient's request-level retry. Read and status
+    retries stay with HttpClient.
+    
+    Args:
+        session: Session to configure in place.
+    
+    Returns:
+        The same session, for chaining.
+    """
+    retries = Retry(total=2, connect=2, read=0, status=0, backoff_factor=0.1)
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retries)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({
+        "Accept-Encoding": "gzip, deflate",
+        "Connection": "keep-alive",
+    })
+    return session
+
+
+def get_session() -> requests.Session:
+    """
+    Return the shared requests.Session used for API calls.
+    
+    Reusing one session keeps TCP/TLS connections to the API host alive
+    between requests instead of paying a new handshake for every call.
+    Created lazily on first use; the session is module state, so each
+    pytest-xdist worker process builds and pools its own.
+    
+    Returns:
+        Shared requests.Session instance.
+    """
+    global _SESSION
+    if _SESSION is None:
+        _SESSION = configure_session(requests.Session())
+    return _SESSION
+
+
 # --- Utilities ---
 def build_url(path: str) -> str:
     """
@@ -214,10 +271,13 @@ def post(
     try:
         url = build_url(path)
         h = build_headers(with_apikey=with_apikey, extra=extra_headers)
-        print(f"[INFO] POST {url}")
-        return requests.post(url, json=json, params=params, headers=h, timeout=15)
+        logger.debug("POST %s", url)
+        # Encode the body ourselves (orjson when installed); Content-Type is
+        # already set by build_headers
+        data = dumps_bytes(json) if json is not None else None
+        return get_session().post(url, data=data, params=params, headers=h, timeout=15)
     except Exception as e:
-        print(f"[ERROR] POST request failed: {e}")
+        logger.error("POST request failed: %s", e)
         raise
 
 
@@ -241,8 +301,8 @@ def get(path: str, params: Optional[Dict[str, Any]] = None, with_apikey: bool =
     try:
         url = build_url(path)
         h = build_headers(with_apikey=with_apikey, extra=extra_headers)
-        print(f"[INFO] GET {url}")
-        return requests.get(url, params=params, headers=h, timeout=15)
+        logger.debug("GET %s", url)
+        return get_session().get(url, params=params, headers=h, timeout=15)
     except Exception as e:
-        print(f"[ERROR] GET request failed: {e}")
+        logger.error("GET request failed: %s", e)
         raise
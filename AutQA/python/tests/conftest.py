@@ -6,11 +6,15 @@ test data, and authentication tokens.
 from __future__ import annotations
 
 import json
+import logging
+import os
 import pytest
 import sys
 from datetime import datetime
 from pathlib import Path
 
+logger = logging.getLogger(__name__)
+
 # Add project root to Python path
 project_root = Path(__file__).parent.parent
 if str(project_root) not in sys.path:
@@ -45,9 +49,24 @@ def pytest_configure(config):
     Pytest hook that runs before test collection.
     Automatically refreshes JWT token if expired or about to expire.
     """
+    # Test output goes through logging (WARNING by default); --api-log or
+    # AUTQA_API_LOG=1 surfaces the INFO-level request/response logging.
+    # Directory conftests read the decision from config._autqa_api_log.
+    config._autqa_api_log = bool(config.getoption("--api-log")) or \
+        os.getenv("AUTQA_API_LOG", "").lower() in ("1", "true", "yes")
+    if config._autqa_api_log:
+        if config.option.log_level is None:
+            config.option.log_level = "INFO"
+        if config.option.log_cli_level is None:
+            config.option.log_cli_level = "INFO"
+
     if not FRAMEWORK_AVAILABLE:
         print("[WARNING] Framework not available - skipping JWT refresh")
         return
+
+    # Under pytest-xdist only the controller refreshes; workers would race on .env
+    if hasattr(config, "workerinput"):
+        return
     
     # Framework available - proceed with JWT refresh
     
@@ -115,9 +134,60 @@ def pytest_configure(config):
         print(f"[WARNING] Error during auto token refresh: {e}")
 
 
+def pytest_addoption(parser):
+    """Register project command-line options."""
+    parser.addoption(
+        "--api-log",
+        action="store_true",
+        default=False,
+        help="Log every API request/response (console, Allure, artifacts). "
+             "Also enabled by AUTQA_API_LOG=1.",
+    )
+
+
 def pytest_sessionstart(session):
     """Store a unique run_id (timestamp) on config for artifact grouping."""
-    session.config._run_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+    workerinput = getattr(session.config, "workerinput", None)
+    if workerinput and "run_id" in workerinput:
+        session.config._run_id = workerinput["run_id"]
+    else:
+        session.config._run_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """pytest-xdist: share the controller's run_id so all workers write to one artifacts dir."""
+    run_id = getattr(node.config, "_run_id", None) or datetime.now().strftime("%Y%m%d_%H%M%S")
+    node.workerinput["run_id"] = run_id
+
+
+# Directories whose face_image_base64 tests need an .env key, and the key
+_FACE_IMAGE_ENV_KEYS = {
+    Path(__file__).parent / "stateless_apis" / "face_matcher": "TEST",
+    Path(__file__).parent / "stateless_apis" / "face_liveness": "TX_DL_FACE_B64",
+}
+
+
+def pytest_collection_modifyitems(config, items):
+    """
+    Skip face_image_base64 tests at collection when their directory's .env key is missing.
+
+    Reads .env once for the whole run instead of skipping from each test's
+    fixture setup; the fixtures keep their own check as a fallback.
+    """
+    env = None
+    for item in items:
+        if "face_image_base64" not in getattr(item, "fixturenames", ()):
+            continue
+        for directory, key in _FACE_IMAGE_ENV_KEYS.items():
+            if directory not in item.path.parents:
+                continue
+            if env is None:
+                from autqa.core.config import default_env_path
+                env = EnvStore(default_env_path()).read() if FRAMEWORK_AVAILABLE else {}
+            if not env.get(key):
+                item.add_marker(pytest.mark.skip(reason=f"{key} not found in .env file"))
+            break
 
 
 def pytest_sessionfinish(session, exitstatus):
@@ -125,6 +195,10 @@ def pytest_sessionfinish(session, exitstatus):
     import webbrowser
     from pathlib import Path
 
+    # Only the controller opens the report when running under pytest-xdist
+    if hasattr(session.config, "workerinput"):
+        return
+
     report_path = Path(__file__).parent.parent / "report.html"
     if report_path.exists():
         print(f"\n[INFO] Opening HTML report: {report_path}")
@@ -160,6 +234,84 @@ def api_client():
     return client
 
 
+@pytest.fixture(scope="session", autouse=True)
+def http_cache():
+    """
+    Opt-in HTTP response cache (set AUTQA_HTTP_CACHE=1 or =replay).
+
+    AUTQA_HTTP_CACHE=1: parametrized runs re-read the same customerConfig;
+    with the cache on, repeated admin GETs within 60s are served locally.
+    Any POST/DELETE clears the cache, but a GET issued right after a write
+    can still return (and cache) the old value if the server applies the
+    write lazily; code that polls for a write to land must read through
+    session.cache_disabled() (see enrollment_config).
+
+    AUTQA_HTTP_CACHE=replay: local iteration only. Stateless face liveness
+    and face matcher calls (GET and POST) are stored in .autqa_cache/ keyed
+    on method, URL and body hash, so re-running e.g. `-k workflow` replays
+    identical requests from disk. The 400/404/500 responses the negative
+    tests assert on are stored too; 401s are not. Never use it for real CI runs.
+
+    Requires the optional requests-cache package.
+    """
+    mode = os.getenv("AUTQA_HTTP_CACHE", "").lower()
+    if mode not in ("1", "true", "yes", "replay"):
+        yield None
+        return
+
+    try:
+        import client
+        import requests_cache
+    except ImportError:
+        print("[WARNING] AUTQA_HTTP_CACHE is set but requests-cache is not installed")
+        yield None
+        return
+
+    patcher = pytest.MonkeyPatch()
+    if mode == "replay":
+        session = requests_cache.CachedSession(
+            str(Path(__file__).parent.parent / ".autqa_cache" / "http"),
+            backend="sqlite",
+            allowable_methods=("GET", "POST"),
+            # Negative tests assert on 400/404/500; 401 is left out so an
+            # expired token is never replayed
+            allowable_codes=(200, 400, 404, 500),
+            urls_expire_after={
+                "*/faceliveness/*": requests_cache.NEVER_EXPIRE,
+                "*/nexaface/*": requests_cache.NEVER_EXPIRE,
+                "*": requests_cache.DO_NOT_CACHE,
+            },
+        )
+    else:
+        session = requests_cache.CachedSession(
+            backend="memory",
+            allowable_methods=("GET",),
+            urls_expire_after={
+                "*/onboarding/admin/*": 60,
+                "*": requests_cache.DO_NOT_CACHE,
+            },
+        )
+
+        def invalidating(method):
+            def wrapper(*args, **kwargs):
+                response = method(*args, **kwargs)
+                session.cache.clear()
+                return response
+            return wrapper
+
+        patcher.setattr(session, "post", invalidating(session.post))
+        patcher.setattr(session, "delete", invalidating(session.delete))
+
+    # Swap the cached session in as the shared API session
+    client.configure_session(session)
+    patcher.setattr(client, "_SESSION", session)
+    try:
+        yield session.cache
+    finally:
+        patcher.undo()
+        session.close()
+
+
 @pytest.fixture
 def enrollment_service(api_client):
     """
@@ -170,9 +322,15 @@ def enrollment_service(api_client):
     return service
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def env_store():
-    """Environment store for reading/writing .env."""
+    """
+    Environment store for reading/writing .env.
+    
+    Session-scoped: EnvStore holds only the file path and reads the file on
+    every get(), so one instance serves all tests and lets session-scoped
+    fixtures depend on it.
+    """
     from autqa.core.config import default_env_path
     return EnvStore(default_env_path())
 
@@ -231,7 +389,10 @@ def pytest_runtest_makereport(item, call):
             artifacts_dir.mkdir(parents=True, exist_ok=True)
             artifact_path = artifacts_dir / f"{safe_name}.json"
             artifact_path.write_text(json.dumps(artifact, indent=2), encoding="utf-8")
-            print(f"\n[ARTIFACT] Written: {artifact_path}")
+            logger.info("[ARTIFACT] Written: %s", artifact_path)
+
+            # Items live until the session ends; drop the bodies now
+            item._api_transactions = []
 
     # ── Admin portal report (call phase only) ────────────────────────────────
     if rep.when == "call":
@@ -247,11 +408,11 @@ def pytest_runtest_makereport(item, call):
                 error_msg = str(call.excinfo.value)
 
             test_name = item.nodeid.split("::")[-1]
-            print(f"\n[ADMIN REPORT] {test_name}: {status}")
+            logger.info("[ADMIN REPORT] %s: %s", test_name, status)
             if error_msg:
-                print(f"[ADMIN REPORT] Error: {error_msg}")
+                logger.info("[ADMIN REPORT] Error: %s", error_msg)
         except Exception as e:
-            print(f"\n[WARNING] Failed to report to admin portal: {e}")
+            logger.warning("Failed to report to admin portal: %s", e)
 
 
 # ==============================================================================
@@ -309,12 +470,12 @@ def pytest_runtest_logreport(report):
         "response_code": response_code
     }
     
-    # Print to console
-    print(f"\n[ADMIN REPORT] {test_name}: {pytest_status}")
+    # Log (shown with --api-log or --log-cli-level=INFO)
+    logger.info("[ADMIN REPORT] %s: %s", test_name, pytest_status)
     if server_status:
-        print(f"[ADMIN REPORT] Server Status: {server_status}")
+        logger.info("[ADMIN REPORT] Server Status: %s", server_status)
     if response_code:
-        print(f"[ADMIN REPORT] Response Code: {response_code}")
+        logger.info("[ADMIN REPORT] Response Code: %s", response_code)
     
     # If there's an error, show brief message
     if report.failed and hasattr(report, "longreprtext"):
@@ -322,7 +483,7 @@ def pytest_runtest_logreport(report):
         for line in error_lines:
             if "AssertionError:" in line or "Error:" in line:
                 error_msg = line.strip()[:200]  # Limit length
-                print(f"[ADMIN REPORT] Error: {error_msg}")
+                logger.info("[ADMIN REPORT] Error: %s", error_msg)
                 break
     
     # TODO: Send to your admin API
@@ -35,8 +35,9 @@ def unique_username():
     unique_id = uuid.uuid4().hex[:6]
     return f"dantest_{timestamp}_{unique_id}"[:50]
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def face_image(env_vars):
+    # Normalized once per session; face_frames hands it through unchanged
     image = (
         env_vars.get("FACE") or
         env_vars.get("DAN_FACE") or
@@ -45,7 +46,7 @@ def face_image(env_vars):
     if not image:
         pytest.skip("Face image not found in .env (set FACE=<base64>)")
     if image.startswith("data:image"):
-        image = image.split(",")[1]
+        image = image.partition(",")[2]
     return image.strip()
 
 @pytest.fixture
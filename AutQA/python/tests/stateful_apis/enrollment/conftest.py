@@ -1,4 +1,196 @@
-﻿import pytest
+﻿import base64
+import contextlib
+import logging
+import time
+from pathlib import Path
+
+import pytest
+
+from client import get_session
+
+from autqa.utils.payload_builders import normalize_base64
+from autqa.utils.timing_helpers import poll_until
+
+logger = logging.getLogger(__name__)
+
+# Base64 image keys in .env that tests send as document/face payloads
+KNOWN_IMAGE_KEYS = frozenset({
+    "FACE",
+    "SPOOF",
+    "DAN_DOC_FRONT",
+    "DAN_DOC_BACK",
+    "PASS_FACE_DAN",
+    "PASS_FRONT_DAN",
+    "TX_DL_FRONT_b64",
+    "TX_DL_BACK_b64",
+    "TX_DL_FACE_B64",
+    "OCR_FRONT",
+    "OCR_BACK",
+    "OCR_FACE",
+})
+
+
+@pytest.fixture(scope="session")
+def normalized_env(env_vars):
+    """Base64 image values from .env, normalized once per session."""
+    return {k: normalize_base64(v) for k, v in env_vars.items() if k in KNOWN_IMAGE_KEYS}
+
+
+# Optional on-disk image sources (<KEY>.jpg), preferred over the .env values
+IMAGES_DIR = Path(__file__).resolve().parents[3] / "samples" / "images"
+
+
+@pytest.fixture(scope="session")
+def image_b64(normalized_env):
+    """
+    Base64 images keyed by .env name, loaded once per session.
+
+    samples/images/<KEY>.jpg is read and encoded when present so large
+    images don't have to travel through .env; otherwise the normalized
+    .env value is used.
+    """
+    images = dict(normalized_env)
+    for key in KNOWN_IMAGE_KEYS:
+        path = IMAGES_DIR / f"{key}.jpg"
+        if path.is_file():
+            images[key] = base64.b64encode(path.read_bytes()).decode("ascii")
+    return images
+
+
+# customerConfig enrollment options the document scenarios depend on
+DOCUMENT_ENROLLMENT_OPTIONS = {
+    "ageEstimation": {"enabled": False},
+    "addDocument": True,
+    "addFace": True,
+    "addDevice": True,
+}
+
+
+def _enrollment_options(api_client):
+    response = api_client.http_client.get("/onboarding/admin/customerConfig")
+    if response.status_code != 200:
+        return None, {}
+    config = response.json().get("onboardingConfig", {})
+    return config, config.get("onboardingOptions", {}).get("enrollment", {})
+
+
+def _cache_bypass():
+    """Context that skips the requests-cache layer (AUTQA_HTTP_CACHE), if active."""
+    cache_disabled = getattr(get_session(), "cache_disabled", None)
+    return cache_disabled() if cache_disabled else contextlib.nullcontext()
+
+
+def _options_applied(enrollment):
+    return (
+        enrollment.get("addDocument") is True
+        and enrollment.get("addFace") is True
+        and enrollment.get("addDevice") is True
+        and not enrollment.get("ageEstimation", {}).get("enabled", False)
+    )
+
+
+@pytest.fixture(scope="module")
+def enrollment_config(api_client_session):
+    """
+    Enable document + face + device enrollment once per module.
+
+    The config is only POSTed when it differs from the target, and the
+    update is confirmed by polling instead of a fixed sleep. Module scope
+    because other enrollment modules rewrite customerConfig.
+    """
+    current_config, enrollment = _enrollment_options(api_client_session)
+    if current_config is None:
+        pytest.skip("Could not read customerConfig")
+
+    if not _options_applied(enrollment):
+        # Rebuild only the branches being changed; the rest is shared as-is
+        onboarding_options = current_config.get("onboardingOptions", {})
+        new_config = {
+            **current_config,
+            "onboardingOptions": {
+                **onboarding_options,
+                "enrollment": {
+                    **enrollment,
+                    **DOCUMENT_ENROLLMENT_OPTIONS,
+                    "ageEstimation": dict(DOCUMENT_ENROLLMENT_OPTIONS["ageEstimation"]),
+                },
+            },
+        }
+        api_client_session.http_client.post(
+            "/onboarding/admin/customerConfig",
+            json={"onboardingConfig": new_config}
+        )
+        # Poll past the optional http_cache: a stale first read must not be
+        # cached and then served back to every later poll
+        with _cache_bypass():
+            applied = poll_until(
+                lambda: _options_applied(_enrollment_options(api_client_session)[1]),
+                timeout=5.0,
+                poll_interval=0.25,
+                max_interval=1.0,
+                description="customerConfig update",
+            )
+        if not applied:
+            pytest.fail("customerConfig update was not applied")
+
+    return DOCUMENT_ENROLLMENT_OPTIONS
+
+
+@pytest.fixture
+def document_enrollment(api_client, enrollment_config, unique_username, env_vars, face_frames, workflow):
+    """
+    Enrollment token that has passed enroll, addDevice and addFace.
+
+    Only addDocumentOCR is left, so document tests differ only in their
+    OCR payload. The addFace liveness decision must be LIVE.
+
+    Function-scoped: the OCR step completes the enrollment, so one token
+    cannot serve more than one document scenario.
+    """
+    enroll_response = api_client.http_client.post("/onboarding/enrollment/enroll", json={
+        "username": unique_username,
+        "email": f"{unique_username}@example.com",
+        "firstName": env_vars.get("FIRSTNAME", "Dan"),
+        "lastName": env_vars.get("LASTNAME", "Nicolau"),
+    })
+    if enroll_response.status_code != 200:
+        pytest.fail(f"Enroll failed: {enroll_response.status_code}")
+    enrollment_token = enroll_response.json().get("enrollmentToken")
+    logger.info(f"✅ Enrolled: {unique_username}")
+
+    device_response = api_client.http_client.post("/onboarding/enrollment/addDevice", json={
+        "enrollmentToken": enrollment_token,
+        "deviceId": f"device_{int(time.time())}",
+        "platform": "web"
+    })
+    if device_response.status_code != 200:
+        pytest.fail(f"Add device failed: {device_response.status_code}")
+    logger.info("✅ Device registered")
+
+    face_response = api_client.http_client.post("/onboarding/enrollment/addFace", json={
+        "enrollmentToken": enrollment_token,
+        "faceLivenessData": {
+            "video": {
+                "meta_data": {"username": unique_username},
+                "workflow_data": {"workflow": workflow, "frames": face_frames},
+            },
+        },
+    })
+    if face_response.status_code != 200:
+        pytest.fail(f"Add face failed: {face_response.status_code}")
+    liveness_decision = (
+        face_response.json()
+        .get("faceLivenessResults", {})
+        .get("video", {})
+        .get("liveness_result", {})
+        .get("decision", "UNKNOWN")
+    )
+    logger.info(f"✅ Face enrolled (liveness: {liveness_decision})")
+    # Every document scenario enrolls a face first, so liveness is checked here
+    assert liveness_decision == "LIVE", f"Liveness must pass, got {liveness_decision}"
+
+    return enrollment_token
+
 
 @pytest.fixture
 def enrollment_token(api_client, unique_username, env_vars):
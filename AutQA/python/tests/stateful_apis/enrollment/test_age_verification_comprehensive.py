@@ -7,6 +7,7 @@ import copy
 import time
 import logging
 from datetime import datetime
+from autqa.utils.json_utils import json_or_empty
 
 logger = logging.getLogger(__name__)
 
@@ -259,7 +260,7 @@ class TestAgeVerificationComprehensive:
             json=face_payload
         )
         
-        face_data = face_response.json() if face_response.status_code == 200 else {}
+        face_data = json_or_empty(face_response)
         face_tx_id = face_data.get("transactionId", "N/A")
         face_timestamp = datetime.now()
         face_duration = (face_timestamp - step_start).total_seconds()
@@ -8,26 +8,18 @@ import time
 import logging
 import json
 from datetime import datetime
+from autqa.utils.payload_builders import normalize_base64
 from autqa.utils.your_document_validator import (
     extract_document_ocr_data,
     validate_document,
     generate_document_report
 )
 from autqa.utils.ocr_analyzer import analyze_ocr_response, generate_ocr_analysis_report
+from autqa.utils.json_utils import json_or_empty
 
 logger = logging.getLogger(__name__)
 
 
-def normalize_base64(data: str) -> str:
-    """Remove data URI prefix if present"""
-    if not data:
-        return data
-    data = data.strip()
-    if data.startswith('data:') and ',' in data:
-        data = data.split(',', 1)[1]
-    return data
-
-
 # ============================================================================
 # TEST SCENARIOS - Different validation configurations
 # ============================================================================
@@ -315,7 +307,7 @@ class TestComprehensiveFieldValidation:
         logger.info(json.dumps(scenario["processingInstructions"], indent=2))
         
         doc_response = api_client.http_client.post("/onboarding/enrollment/addDocumentOCR", json=doc_payload)
-        doc_data = doc_response.json() if doc_response.status_code == 200 else {}
+        doc_data = json_or_empty(doc_response)
         
         # ====================================================================
         # COMPREHENSIVE ANALYSIS
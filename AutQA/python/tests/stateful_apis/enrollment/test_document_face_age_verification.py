@@ -7,11 +7,13 @@ import copy
 import time
 import logging
 from datetime import datetime
+from autqa.utils.payload_builders import normalize_base64
 from autqa.utils.your_document_validator import (
     extract_document_ocr_data,
     validate_document,
     generate_document_report
 )
+from autqa.utils.json_utils import json_or_empty
 
 logger = logging.getLogger(__name__)
 
@@ -26,16 +28,6 @@ AGE_SCENARIOS = [
 DELAYS = {"after_config": 1.0, "after_enroll": 1.0, "after_face": 3.0, "after_document": 5.0}
 
 
-def normalize_base64(data: str) -> str:
-    """Remove data URI prefix if present"""
-    if not data:
-        return data
-    data = data.strip()
-    if data.startswith('data:') and ',' in data:
-        data = data.split(',', 1)[1]
-    return data
-
-
 @pytest.mark.stateful
 @pytest.mark.enrollment
 @pytest.mark.document
@@ -174,7 +166,7 @@ class TestDocumentFaceAgeVerification:
             },
         })
         
-        face_data = face_response.json() if face_response.status_code == 200 else {}
+        face_data = json_or_empty(face_response)
         face_tx_id = face_data.get("transactionId", "N/A")
         face_timestamp = datetime.now()
         
@@ -11,21 +11,17 @@ import time
 import logging
 import json
 from datetime import datetime
-from autqa.utils.ocr_analyzer import analyze_ocr_response, generate_ocr_analysis_report
+from autqa.utils.payload_builders import normalize_base64
+from autqa.utils.ocr_analyzer import (
+    analyze_ocr_response,
+    enrollment_status_name,
+    generate_ocr_analysis_report,
+)
+from autqa.utils.json_utils import json_or_empty
 
 logger = logging.getLogger(__name__)
 
 
-def normalize_base64(data: str) -> str:
-    """Remove data URI prefix if present"""
-    if not data:
-        return data
-    data = data.strip()
-    if data.startswith('data:') and ',' in data:
-        data = data.split(',', 1)[1]
-    return data
-
-
 # Test scenarios
 DOCUMENT_SCENARIOS = [
     {
@@ -208,7 +204,7 @@ class TestDocumentFaceMatching:
         logger.info(f"   Expected Face Match: {scenario['expected_face_match']}")
         
         doc_response = api_client.http_client.post("/onboarding/enrollment/addDocumentOCR", json=doc_payload)
-        doc_data = doc_response.json() if doc_response.status_code == 200 else {}
+        doc_data = json_or_empty(doc_response)
         
         # ====================================================================
         # RESPONSE ANALYSIS
@@ -225,7 +221,7 @@ class TestDocumentFaceMatching:
         
         logger.info(f"\n📄 Document Verification:")
         logger.info(f"   Document Verified: {doc_verified}")
-        logger.info(f"   Enrollment Status: {enrollment_status} ({['FAILED', 'PENDING', 'COMPLETE'][enrollment_status] if enrollment_status in [0,1,2] else 'UNKNOWN'})")
+        logger.info(f"   Enrollment Status: {enrollment_status} ({enrollment_status_name(enrollment_status)})")
         
         logger.info(f"\n👤 Face Matching:")
         logger.info(f"   Match Result: {match_result}")
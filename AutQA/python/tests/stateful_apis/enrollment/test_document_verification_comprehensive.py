@@ -7,6 +7,7 @@ import copy
 import time
 import logging
 from datetime import datetime
+from autqa.utils.payload_builders import normalize_base64
 from autqa.utils.your_document_validator import (
     extract_document_ocr_data, 
     validate_document, 
@@ -16,16 +17,6 @@ from autqa.utils.your_document_validator import (
 logger = logging.getLogger(__name__)
 
 
-def normalize_base64(data: str) -> str:
-    """Remove data URI prefix if present"""
-    if not data:
-        return data
-    data = data.strip()
-    if data.startswith('data:') and ',' in data:
-        data = data.split(',', 1)[1]
-    return data
-
-
 # ============================================================================
 # TEST 1: DOCUMENT VERIFICATION RESULT
 # ============================================================================
@@ -8,21 +8,13 @@ import time
 import logging
 import json
 from datetime import datetime
+from autqa.utils.payload_builders import normalize_base64
 from autqa.utils.ocr_analyzer import analyze_ocr_response, generate_ocr_analysis_report
+from autqa.utils.json_utils import json_or_empty
 
 logger = logging.getLogger(__name__)
 
 
-def normalize_base64(data: str) -> str:
-    """Remove data URI prefix if present"""
-    if not data:
-        return data
-    data = data.strip()
-    if data.startswith('data:') and ',' in data:
-        data = data.split(',', 1)[1]
-    return data
-
-
 @pytest.mark.stateful
 @pytest.mark.enrollment
 class TestDocumentWithBiometrics:
@@ -151,7 +143,7 @@ class TestDocumentWithBiometrics:
         logger.info(f"Fields: * (all)")
         
         doc_response = api_client.http_client.post("/onboarding/enrollment/addDocumentOCR", json=doc_payload)
-        doc_data = doc_response.json() if doc_response.status_code == 200 else {}
+        doc_data = json_or_empty(doc_response)
         
         # ====================================================================
         # RAW RESPONSE (for debugging field structure)
@@ -8,6 +8,8 @@ import copy
 import time
 import logging
 from datetime import datetime
+from autqa.utils.ocr_analyzer import enrollment_status_name
+from autqa.utils.json_utils import json_or_empty
 
 logger = logging.getLogger(__name__)
 
@@ -217,7 +219,7 @@ def test_enroll_with_age_1_to_16_gold_standard(
     }
     
     face_response = api_client.http_client.post("/onboarding/enrollment/addFace", json=face_payload)
-    face_data = face_response.json() if face_response.status_code == 200 else {}
+    face_data = json_or_empty(face_response)
     
     face_tx_id = face_data.get("transactionId", "N/A")
     face_timestamp = datetime.now()
@@ -324,7 +326,7 @@ def test_enroll_with_age_1_to_16_gold_standard(
     logger.info(f"   Detected Age: {age_from_server} years" if age_from_server else "   Age: NOT DETECTED")
     logger.info(f"   Age Verification: {actual_result}")
     logger.info(f"   Liveness Check: {liveness_decision}")
-    logger.info(f"   Enrollment Status: {enrollment_status} ({['FAILED', 'PENDING', 'COMPLETE'][enrollment_status] if enrollment_status in [0,1,2] else 'UNKNOWN'})")
+    logger.info(f"   Enrollment Status: {enrollment_status} ({enrollment_status_name(enrollment_status)})")
     
     behavior_match = actual_result == EXPECTED_RESULT
     
@@ -7,6 +7,7 @@ import copy
 import time
 import logging
 from datetime import datetime
+from autqa.utils.json_utils import json_or_empty
 
 logger = logging.getLogger(__name__)
 
@@ -169,7 +170,7 @@ def test_enroll_with_age_verification_1_to_101(
         },
     })
     
-    face_data = face_response.json() if face_response.status_code == 200 else {}
+    face_data = json_or_empty(face_response)
     face_tx_id = face_data.get("transactionId", "N/A")
     
     # Extract data
@@ -7,6 +7,8 @@ import copy
 import time
 import logging
 from datetime import datetime
+from autqa.utils.ocr_analyzer import enrollment_status_name
+from autqa.utils.json_utils import json_or_empty
 
 logger = logging.getLogger(__name__)
 
@@ -202,7 +204,7 @@ class TestFaceOnlyAgeVerification:
             json=face_payload
         )
         
-        face_data = face_response.json() if face_response.status_code == 200 else {}
+        face_data = json_or_empty(face_response)
         face_tx_id = face_data.get("transactionId", "N/A")
         face_timestamp = datetime.now()
         face_duration = (face_timestamp - step_start).total_seconds()
@@ -251,7 +253,7 @@ class TestFaceOnlyAgeVerification:
         logger.info(f"Status: {face_status}")
         logger.info(f"Duration: {face_duration:.2f}s")
         logger.info(f"Timestamp: {face_timestamp.strftime('%m/%d/%Y, %I:%M:%S %p')}")
-        logger.info(f"Enrollment Status: {enrollment_status} ({['FAILED', 'PENDING', 'COMPLETE'][enrollment_status] if enrollment_status in [0,1,2] else 'UNKNOWN'})")
+        logger.info(f"Enrollment Status: {enrollment_status} ({enrollment_status_name(enrollment_status)})")
         if registration_code:
             logger.info(f"Registration Code: {registration_code}")
         
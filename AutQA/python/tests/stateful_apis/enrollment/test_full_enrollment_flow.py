@@ -6,20 +6,11 @@ import pytest
 import logging
 import time
 from datetime import datetime
+from autqa.utils.payload_builders import normalize_base64
 
 logger = logging.getLogger(__name__)
 
 
-def normalize_base64(data: str) -> str:
-    """Remove data URI prefix if present"""
-    if not data:
-        return data
-    data = data.strip()
-    if data.startswith('data:') and ',' in data:
-        data = data.split(',', 1)[1]
-    return data
-
-
 @pytest.mark.stateful
 @pytest.mark.enrollment
 class TestFullEnrollmentFlow:
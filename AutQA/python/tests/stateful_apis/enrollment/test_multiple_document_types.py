@@ -3,62 +3,101 @@ Document OCR Test with Multiple Document Types
 Tests both Driver License and Passport with biometricsInfo
 """
 import pytest
-import copy
-import time
+import re
 import logging
 import json
 from datetime import datetime
-from autqa.utils.ocr_analyzer import analyze_ocr_response, generate_ocr_analysis_report
+from types import SimpleNamespace
+from autqa.utils.json_utils import response_json
+from autqa.utils.logger import LogBuffer
+from autqa.utils.ocr_analyzer import (
+    analyze_ocr_response,
+    enrollment_status_name,
+    generate_ocr_analysis_report,
+)
 
 logger = logging.getLogger(__name__)
 
+# Section banners, built once rather than on every log call
+_TARGET_BANNER = "🎯" * 60
+_RULE = "=" * 120
 
-def normalize_base64(data: str) -> str:
-    """Remove data URI prefix if present"""
-    if not data:
-        return data
-    data = data.strip()
-    if data.startswith('data:') and ',' in data:
-        data = data.split(',', 1)[1]
-    return data
+
+# Field-name keywords per category, checked in priority order when categorizing.
+# Names are matched by whole word, so e.g. "Page" no longer counts as a date field.
+_WORD_RE = re.compile(r"[a-z]+")
+_CATEGORY_KEYWORDS = (
+    ("identity", frozenset({"name", "surname", "given", "sex", "personal"})),
+    ("date", frozenset({"date", "age", "expire", "issue", "birth", "month"})),
+    ("location", frozenset({"address", "city", "state", "place", "issuing", "nationality", "country"})),
+    ("technical", frozenset({"mrz", "check", "digit", "class", "type", "optional", "document"})),
+)
+
+
+def categorize_field(lower_name: str) -> str:
+    """Return the category of a lower-cased OCR field name ("other" if none match)"""
+    tokens = set(_WORD_RE.findall(lower_name))
+    for category, keywords in _CATEGORY_KEYWORDS:
+        if not tokens.isdisjoint(keywords):
+            return category
+    return "other"
+
+
+_RESULT_ICONS = {"OK": "✅", "FAILED": "❌"}
+
+
+def log_field_category(out: LogBuffer, title: str, rows: list, limit: int = None, skip_empty: bool = False) -> None:
+    """Add one category of (name, value, result) field rows to a log buffer"""
+    if not rows or not out.enabled:
+        return
+    out.add(f"\n{title} ({len(rows)}):")
+    for name, val, result in (rows[:limit] if limit else rows):
+        if skip_empty and not val:
+            continue
+        out.add(f"   {_RESULT_ICONS.get(result, '⚠️')} {name}: {val if val else '[empty]'}")
 
 
 # Test scenarios for different document types
 DOCUMENT_SCENARIOS = [
-    {
-        "name": "Driver License (TX DL)",
-        "doc_type": "Driver License",
-        "face_env_var": "FACE",
-        "doc_front_env_var": "DAN_DOC_FRONT",
-        "doc_back_env_var": "DAN_DOC_BACK",
-        "min_age": 18,
-        "max_age": 101
-    },
-    {
-        "name": "Passport (Romania)",
-        "doc_type": "Passport",
-        "face_env_var": "PASS_FACE_DAN",
-        "doc_front_env_var": "PASS_FRONT_DAN",
-        "doc_back_env_var": None,  # Passports typically don't have back
-        "min_age": 18,
-        "max_age": 101
-    }
+    pytest.param(
+        {
+            "name": "Driver License (TX DL)",
+            "doc_type": "Driver License",
+            "face_env_var": "FACE",
+            "doc_front_env_var": "DAN_DOC_FRONT",
+            "doc_back_env_var": "DAN_DOC_BACK",
+            "min_age": 18,
+            "max_age": 101
+        },
+        id="Driver License (TX DL)",
+    ),
+    pytest.param(
+        {
+            "name": "Passport (Romania)",
+            "doc_type": "Passport",
+            "face_env_var": "PASS_FACE_DAN",
+            "doc_front_env_var": "PASS_FRONT_DAN",
+            "doc_back_env_var": None,  # Passports typically don't have back
+            "min_age": 18,
+            "max_age": 101
+        },
+        marks=[pytest.mark.passport],
+        id="Passport (Romania)",
+    ),
 ]
 
 
 @pytest.mark.stateful
 @pytest.mark.enrollment
-@pytest.mark.parametrize("scenario", DOCUMENT_SCENARIOS, ids=[s["name"] for s in DOCUMENT_SCENARIOS])
+@pytest.mark.parametrize("scenario", DOCUMENT_SCENARIOS)
 class TestMultipleDocumentTypes:
     """Test OCR with different document types"""
     
     def test_document_type_with_validation(
         self,
         api_client,
-        unique_username,
-        face_frames,
-        workflow,
-        env_vars,
+        document_enrollment,
+        image_b64,
         caplog,
         scenario
     ):
@@ -67,9 +106,9 @@ class TestMultipleDocumentTypes:
         caplog.set_level(logging.INFO)
         
         # Get images based on scenario
-        face_image = normalize_base64(env_vars.get(scenario["face_env_var"], "").strip())
-        doc_front = normalize_base64(env_vars.get(scenario["doc_front_env_var"], "").strip())
-        doc_back = normalize_base64(env_vars.get(scenario["doc_back_env_var"], "").strip()) if scenario["doc_back_env_var"] else None
+        face_image = image_b64.get(scenario["face_env_var"])
+        doc_front = image_b64.get(scenario["doc_front_env_var"])
+        doc_back = image_b64.get(scenario["doc_back_env_var"]) if scenario["doc_back_env_var"] else None
         
         if not face_image or not doc_front:
             pytest.skip(f"Missing {scenario['face_env_var']} or {scenario['doc_front_env_var']}")
@@ -79,73 +118,19 @@ class TestMultipleDocumentTypes:
         # ====================================================================
         # TEST HEADER
         # ====================================================================
-        logger.info("\n" + "🎯"*60)
-        logger.info(f"DOCUMENT TYPE: {scenario['name']}")
-        logger.info(f"Document Type: {scenario['doc_type']}")
-        logger.info(f"Age Range: {scenario['min_age']}-{scenario['max_age']}")
-        logger.info("🎯"*60)
-        
-        # ====================================================================
-        # SETUP
-        # ====================================================================
-        logger.info("\n" + "="*120)
-        logger.info("ENROLLMENT SETUP")
-        logger.info("="*120)
-        
-        # Config
-        config_response = api_client.http_client.get("/onboarding/admin/customerConfig")
-        current_config = config_response.json().get("onboardingConfig", {})
-        new_config = copy.deepcopy(current_config)
-        
-        enrollment = new_config.setdefault("onboardingOptions", {}).setdefault("enrollment", {})
-        enrollment["ageEstimation"] = {"enabled": False}
-        enrollment['addDocument'] = True
-        enrollment['addFace'] = True
-        enrollment['addDevice'] = True
-        
-        api_client.http_client.post("/onboarding/admin/customerConfig", json={"onboardingConfig": new_config})
-        time.sleep(1)
-        
-        # Enroll
-        enroll_response = api_client.http_client.post("/onboarding/enrollment/enroll", json={
-            "username": unique_username,
-            "email": f"{unique_username}@example.com",
-            "firstName": env_vars.get("FIRSTNAME", "Dan"),
-            "lastName": env_vars.get("LASTNAME", "Nicolau"),
-        })
-        enrollment_token = enroll_response.json().get("enrollmentToken")
-        logger.info(f"✅ Enrolled: {unique_username}")
-        time.sleep(1)
-        
-        # Device
-        device_response = api_client.http_client.post("/onboarding/enrollment/addDevice", json={
-            "enrollmentToken": enrollment_token,
-            "deviceId": f"device_{int(time.time())}",
-            "platform": "web"
-        })
-        logger.info("✅ Device registered")
-        time.sleep(1)
-        
-        # Face
-        face_response = api_client.http_client.post("/onboarding/enrollment/addFace", json={
-            "enrollmentToken": enrollment_token,
-            "faceLivenessData": {
-                "video": {
-                    "meta_data": {"username": unique_username},
-                    "workflow_data": {"workflow": workflow, "frames": face_frames},
-                },
-            },
-        })
-        logger.info("✅ Face enrolled")
-        time.sleep(3)
+        with LogBuffer(logger) as out:
+            out.add(
+                "",
+                _TARGET_BANNER,
+                f"DOCUMENT TYPE: {scenario['name']}",
+                f"Document Type: {scenario['doc_type']}",
+                f"Age Range: {scenario['min_age']}-{scenario['max_age']}",
+                _TARGET_BANNER,
+            )
         
         # ====================================================================
         # DOCUMENT OCR WITH BIOMETRICS
         # ====================================================================
-        logger.info("\n" + "="*120)
-        logger.info(f"DOCUMENT OCR - {scenario['doc_type']}")
-        logger.info("="*120)
-        
         # Build document images
         doc_images = [{"lightingScheme": 6, "image": doc_front, "format": "JPG"}]
         if doc_back:
@@ -153,7 +138,7 @@ class TestMultipleDocumentTypes:
         
         # Build payload
         doc_payload = {
-            "enrollmentToken": enrollment_token,
+            "enrollmentToken": document_enrollment,
             "documentsInfo": {
                 "documentImage": doc_images,
                 "documentPayload": {
@@ -185,164 +170,138 @@ class TestMultipleDocumentTypes:
             }
         }
         
-        logger.info(f"\n📋 Request Details:")
-        logger.info(f"   Document Type: {scenario['doc_type']}")
-        logger.info(f"   Images: {len(doc_images)} (front{' + back' if doc_back else ' only'})")
-        logger.info(f"   Age Validation: {scenario['min_age']}-{scenario['max_age']}")
-        logger.info(f"   Fields: * (all)")
+        with LogBuffer(logger) as out:
+            out.add(
+                "",
+                _RULE,
+                f"DOCUMENT OCR - {scenario['doc_type']}",
+                _RULE,
+                "\n📋 Request Details:",
+                f"   Document Type: {scenario['doc_type']}",
+                f"   Images: {len(doc_images)} (front{' + back' if doc_back else ' only'})",
+                f"   Age Validation: {scenario['min_age']}-{scenario['max_age']}",
+                "   Fields: * (all)",
+            )
         
         doc_response = api_client.http_client.post("/onboarding/enrollment/addDocumentOCR", json=doc_payload)
-        doc_data = doc_response.json() if doc_response.status_code == 200 else {}
+        if doc_response.status_code != 200:
+            pytest.fail(f"OCR failed: {doc_response.status_code} {doc_response.text[:500]}")
+        doc_data = response_json(doc_response)
+        
+        # Resolve the nested OCR sections once; the sections below reuse them
+        ocr_results = doc_data.get("ocrResults") or {}
+        documents_info = ocr_results.get("documentsInfo") or {}
+        field_types = documents_info.get("fieldType") or ocr_results.get("fieldType") or []
+        validation_rules = ocr_results.get("documentValidationRulesResult") or {}
+        requested_rules = validation_rules.get("requestedDocumentValidationRuleResults") or {}
         
         # ====================================================================
         # RESPONSE SUMMARY
         # ====================================================================
-        logger.info("\n" + "="*120)
-        logger.info("📊 RESPONSE SUMMARY")
-        logger.info("="*120)
-        
         doc_verified = doc_data.get("documentVerificationResult")
         enrollment_status = doc_data.get("enrollmentStatus")
         match_result = doc_data.get("matchResult")
         match_score = doc_data.get("matchScore")
         registration_code = doc_data.get("registrationCode")
         
-        logger.info(f"\n📄 Document Results:")
-        logger.info(f"   Document Verified: {doc_verified}")
-        logger.info(f"   Enrollment Status: {enrollment_status} ({['FAILED', 'PENDING', 'COMPLETE'][enrollment_status] if enrollment_status in [0,1,2] else 'UNKNOWN'})")
-        logger.info(f"   Face Match: {match_result} (score: {match_score})")
-        if registration_code:
-            logger.info(f"   Registration Code: {registration_code}")
+        with LogBuffer(logger) as out:
+            out.add(
+                "",
+                _RULE,
+                "📊 RESPONSE SUMMARY",
+                _RULE,
+                "\n📄 Document Results:",
+                f"   Document Verified: {doc_verified}",
+                f"   Enrollment Status: {enrollment_status} ({enrollment_status_name(enrollment_status)})",
+                f"   Face Match: {match_result} (score: {match_score})",
+            )
+            if registration_code:
+                out.add(f"   Registration Code: {registration_code}")
         
         # ====================================================================
         # OCR ANALYSIS
         # ====================================================================
-        logger.info("\n" + "="*120)
-        logger.info("🔍 OCR ANALYSIS")
-        logger.info("="*120)
-        
         ocr_analysis = analyze_ocr_response(doc_data)
         ocr_analysis_report = generate_ocr_analysis_report(ocr_analysis)
         
-        logger.info(ocr_analysis_report)
+        with LogBuffer(logger) as out:
+            out.add("", _RULE, "🔍 OCR ANALYSIS", _RULE, ocr_analysis_report)
         
         # ====================================================================
         # EXTRACTED FIELDS
         # ====================================================================
-        logger.info("\n" + "="*120)
-        logger.info("📝 EXTRACTED FIELDS")
-        logger.info("="*120)
-        
-        ocr_results = doc_data.get("ocrResults", {})
-        documents_info = ocr_results.get("documentsInfo", {})
-        field_types = documents_info.get("fieldType", [])
-        
-        # Also check alternate location
-        if not field_types:
-            field_types = ocr_results.get("fieldType", [])
-        
-        logger.info(f"\nTotal Fields: {len(field_types)}")
-        
-        if field_types:
-            # Categorize
-            identity_fields = []
-            date_fields = []
-            location_fields = []
-            technical_fields = []
-            other_fields = []
+        with LogBuffer(logger) as out:
+            out.add("", _RULE, "📝 EXTRACTED FIELDS", _RULE, f"\nTotal Fields: {len(field_types)}")
             
-            for field in field_types:
-                field_name = field.get("name", "Unknown")
-                overall_result = field.get("overallResult", "UNDEFINED")
-                field_result = field.get("fieldResult", {})
-                
-                visual = field_result.get("visual", "")
-                barcode = field_result.get("barcode", "")
-                mrz = field_result.get("mrz", "")
-                
-                value = visual or barcode or mrz
-                
+            if field_types:
                 # Categorize
-                lower_name = field_name.lower()
-                field_data = (field_name, value, overall_result)
+                identity_fields = []
+                date_fields = []
+                location_fields = []
+                technical_fields = []
+                other_fields = []
+                buckets = {
+                    "identity": identity_fields,
+                    "date": date_fields,
+                    "location": location_fields,
+                    "technical": technical_fields,
+                    "other": other_fields,
+                }
                 
-                if any(word in lower_name for word in ["name", "surname", "given", "sex", "personal"]):
-                    identity_fields.append(field_data)
-                elif any(word in lower_name for word in ["date", "age", "expire", "issue", "birth", "month"]):
-                    date_fields.append(field_data)
-                elif any(word in lower_name for word in ["address", "city", "state", "place", "issuing", "nationality", "country"]):
-                    location_fields.append(field_data)
-                elif any(word in lower_name for word in ["mrz", "check", "digit", "class", "type", "optional", "document #"]):
-                    technical_fields.append(field_data)
-                else:
-                    other_fields.append(field_data)
-            
-            # Display by category
-            if identity_fields:
-                logger.info(f"\n👤 IDENTITY FIELDS ({len(identity_fields)}):")
-                for name, val, result in identity_fields:
-                    icon = "✅" if result == "OK" else "❌" if result == "FAILED" else "⚠️"
-                    logger.info(f"   {icon} {name}: {val if val else '[empty]'}")
-            
-            if date_fields:
-                logger.info(f"\n📅 DATE FIELDS ({len(date_fields)}):")
-                for name, val, result in date_fields:
-                    icon = "✅" if result == "OK" else "❌" if result == "FAILED" else "⚠️"
-                    logger.info(f"   {icon} {name}: {val if val else '[empty]'}")
-            
-            if location_fields:
-                logger.info(f"\n🌍 LOCATION FIELDS ({len(location_fields)}):")
-                for name, val, result in location_fields:
-                    icon = "✅" if result == "OK" else "❌" if result == "FAILED" else "⚠️"
-                    logger.info(f"   {icon} {name}: {val if val else '[empty]'}")
-            
-            if technical_fields:
-                logger.info(f"\n🔧 TECHNICAL FIELDS ({len(technical_fields)}):")
-                for name, val, result in technical_fields[:10]:  # Show first 10
-                    icon = "✅" if result == "OK" else "❌" if result == "FAILED" else "⚠️"
-                    if val:
-                        logger.info(f"   {icon} {name}: {val}")
-            
-            if other_fields:
-                logger.info(f"\n📦 OTHER FIELDS ({len(other_fields)}):")
-                for name, val, result in other_fields[:5]:  # Show first 5
-                    icon = "✅" if result == "OK" else "❌" if result == "FAILED" else "⚠️"
-                    if val:
-                        logger.info(f"   {icon} {name}: {val}")
+                for field in field_types:
+                    field_name = field.get("name", "Unknown")
+                    overall_result = field.get("overallResult", "UNDEFINED")
+                    field_result = field.get("fieldResult", {})
+                    
+                    visual = field_result.get("visual", "")
+                    barcode = field_result.get("barcode", "")
+                    mrz = field_result.get("mrz", "")
+                    
+                    value = visual or barcode or mrz
+                    
+                    # Categorize
+                    lower_name = field_name.lower()
+                    field_data = (field_name, value, overall_result)
+                    
+                    buckets[categorize_field(lower_name)].append(field_data)
+                
+                # Display by category
+                log_field_category(out, "👤 IDENTITY FIELDS", identity_fields)
+                log_field_category(out, "📅 DATE FIELDS", date_fields)
+                log_field_category(out, "🌍 LOCATION FIELDS", location_fields)
+                log_field_category(out, "🔧 TECHNICAL FIELDS", technical_fields, limit=10, skip_empty=True)
+                log_field_category(out, "📦 OTHER FIELDS", other_fields, limit=5, skip_empty=True)
         
         # ====================================================================
         # VALIDATION RULES
         # ====================================================================
-        logger.info("\n" + "="*120)
-        logger.info("📊 VALIDATION RULES")
-        logger.info("="*120)
-        
-        validation_rules = ocr_results.get("documentValidationRulesResult", {})
-        requested_rules = validation_rules.get("requestedDocumentValidationRuleResults", {})
-        
-        if requested_rules:
-            logger.info("\nValidation Results:")
-            for rule_name, rule_result in requested_rules.items():
-                icon = "✅" if rule_result != "FAILED" else "❌"
-                logger.info(f"   {icon} {rule_name}: {rule_result}")
-        else:
-            logger.info("   No validation rules results")
+        with LogBuffer(logger) as out:
+            out.add("", _RULE, "📊 VALIDATION RULES", _RULE)
+            if requested_rules:
+                out.add("\nValidation Results:")
+                for rule_name, rule_result in requested_rules.items():
+                    icon = "✅" if rule_result != "FAILED" else "❌"
+                    out.add(f"   {icon} {rule_name}: {rule_result}")
+            else:
+                out.add("   No validation rules results")
         
         # ====================================================================
         # FINAL VERDICT
         # ====================================================================
-        logger.info("\n" + "="*120)
-        logger.info("🏁 FINAL VERDICT")
-        logger.info("="*120)
-        
-        logger.info(f"\n📋 Test: {scenario['name']}")
-        logger.info(f"   Document Type: {scenario['doc_type']}")
-        logger.info(f"   Overall Status: {ocr_analysis['overall_status']}")
-        logger.info(f"   Critical Issues: {len(ocr_analysis['critical_issues'])}")
-        logger.info(f"   Total Fields: {len(field_types)}")
-        logger.info(f"   Duration: {(datetime.now() - test_start).total_seconds():.2f}s")
-        
-        logger.info("\n" + "="*120 + "\n")
-        
-        # Assertions
-        assert doc_response.status_code == 200, f"OCR failed: {doc_response.status_code}"
+        summary = SimpleNamespace(
+            status=ocr_analysis["overall_status"],
+            critical=len(ocr_analysis["critical_issues"]),
+            fields=len(field_types),
+            duration=(datetime.now() - test_start).total_seconds(),
+        )
+        logger.info(
+            "\n%s\n🏁 FINAL VERDICT\n%s\n"
+            "\n📋 Test: %s\n   Document Type: %s\n   Overall Status: %s\n"
+            "   Critical Issues: %d\n   Total Fields: %d\n   Duration: %.2fs\n"
+            "\n%s\n",
+            _RULE, _RULE,
+            scenario["name"], scenario["doc_type"], summary.status,
+            summary.critical, summary.fields, summary.duration,
+            _RULE,
+        )
+
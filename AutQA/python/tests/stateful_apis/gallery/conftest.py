@@ -2,18 +2,82 @@
 Shared fixtures for Gallery (1-N Match) API tests.
 
 Base path: /onboarding/gallery
+
+Request/response logging (console, Allure attachments and the per-test
+artifact JSON) is opt-in: run with --api-log or set AUTQA_API_LOG=1.
 """
 
-import copy
-import time
+import contextvars
+import logging
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
 import allure
-import json
 import pytest
 
+from client import get_session
+
+from autqa.core.env_store import split_list
+from autqa.utils.json_utils import dumps, loads, response_json
+
+logger = logging.getLogger(__name__)
+
 
 GALLERY_BASE_PATH = "/onboarding/gallery"
 
+# Endpoint URLs, built once
+REGISTER_USER = f"{GALLERY_BASE_PATH}/registerUser"
+MATCH_FACE = f"{GALLERY_BASE_PATH}/matchFace"
+ADD_GALLERY = f"{GALLERY_BASE_PATH}/addGallery"
+DELETE_GALLERY = f"{GALLERY_BASE_PATH}/deleteGallery"
+LIST_GALLERY = f"{GALLERY_BASE_PATH}/listGallery"
+ADD_REGISTRATION_TO_GALLERY = f"{GALLERY_BASE_PATH}/addRegistrationToGallery"
+ADD_REGISTRATIONS_TO_GALLERIES = f"{GALLERY_BASE_PATH}/addRegistrationsToGalleries"
+DELETE_REGISTRATION_FROM_GALLERY = f"{GALLERY_BASE_PATH}/deleteRegistrationFromGallery"
+DELETE_REGISTRATIONS_FROM_GALLERIES = f"{GALLERY_BASE_PATH}/deleteRegistrationsFromGalleries"
+IS_REGISTRATION_IN_GALLERY = f"{GALLERY_BASE_PATH}/isRegistrationInGallery"
+LIST_GALLERY_OF_REGISTRATION = f"{GALLERY_BASE_PATH}/listGalleryOfRegistration"
+LIST_REGISTRATION_IN_GALLERY = f"{GALLERY_BASE_PATH}/listRegistrationInGallery"
+
+
+# .env keys consumed by the gallery fixtures
+GALLERY_ENV_KEYS = (
+    "TEST",
+    "FACE",
+    "SPOOF",
+    "TX_DL_FACE",
+    "GALLERY_REGISTRATION_CODE",
+    "GALLERY_USERNAME",
+    "GALLERY_EMAIL",
+    "GALLERY_REGISTRATION_CODES",
+    "GALLERY_NAMES",
+    "GALLERY_NAME",
+)
+
+
+@pytest.fixture(scope="session")
+def env_snapshot(env_store):
+    """
+    Gallery .env values, read once per session.
+
+    Values are stripped strings, "" when the key is absent or empty.
+    Tests that write one of these keys through env_store must update this
+    dict as well so later fixtures in the same session see the new value.
+    """
+    return {key: env_store.get(key) for key in GALLERY_ENV_KEYS}
+
+
+@pytest.fixture
+def api_client(api_client_session):
+    """
+    Session-wide API client for gallery tests.
+
+    Gallery tests never reconfigure the client, so they share one instance
+    instead of building a fresh client (and re-checking the token) per test.
+    Requests go through the pooled keep-alive session from client.get_session().
+    """
+    return api_client_session
+
 
 @pytest.fixture
 def gallery_base_path():
@@ -21,10 +85,10 @@ def gallery_base_path():
     return GALLERY_BASE_PATH
 
 
-@pytest.fixture
-def gallery_face_image(env_store):
+@pytest.fixture(scope="session")
+def gallery_face_image(env_snapshot):
     """Get face image from .env file (TEST key)."""
-    face_b64 = env_store.get("TEST")
+    face_b64 = env_snapshot["TEST"]
     if not face_b64:
         pytest.skip("TEST not found in .env file - add a valid JPEG face image as TEST=<base64>")
     if face_b64.startswith("data:"):
@@ -32,14 +96,97 @@ def gallery_face_image(env_store):
     return face_b64
 
 
+def assert_error_body(result, error_codes=None):
+    """
+    Assert standard Gallery API error format: {errorCode, errorMsg, status, timestamp}.
+
+    If error_codes is given, errorCode must be one of them.
+    """
+    assert "errorCode" in result, f"Expected 'errorCode' in error response, got: {result}"
+    assert "errorMsg" in result, f"Expected 'errorMsg' in error response, got: {result}"
+    assert "status" in result, f"Expected 'status' in error response, got: {result}"
+    assert "timestamp" in result, f"Expected 'timestamp' in error response, got: {result}"
+    if error_codes is not None:
+        assert result["errorCode"] in error_codes, (
+            f"Unexpected errorCode: {result['errorCode']}"
+        )
+    logger.info("[OK] Error - errorCode: %s, errorMsg: %s", result['errorCode'], result['errorMsg'])
+
+
+# Page size for membership listings; larger galleries are paged through
+MEMBERS_PAGE_SIZE = 1000
+
+
+def gallery_members(api_client, gallery_name, page_size=MEMBERS_PAGE_SIZE):
+    """
+    Return the set of registration codes enrolled in a gallery.
+
+    Pages through listRegistrationInGallery (usually one call) instead of
+    an isRegistrationInGallery round trip per user when checking many users
+    at once, and checks the codes collected against totalRecords. Not
+    cached: membership changes as the tests run.
+    """
+    members = set()
+    page = 1
+    while True:
+        response = api_client.http_client.post(
+            LIST_REGISTRATION_IN_GALLERY,
+            json={"galleryName": gallery_name, "pageNumber": page, "pageSize": page_size},
+        )
+        assert response.status_code == 200, (
+            f"listRegistrationInGallery failed for '{gallery_name}' page {page} "
+            f"({response.status_code}): {response.text[:200]}"
+        )
+        result = response_json(response)
+        records = result.get("list", [])
+        members.update(u.get("registrationCode") for u in records)
+        if not records or page >= result.get("totalPages", 1):
+            break
+        page += 1
+
+    total = result.get("totalRecords")
+    assert total is None or len(members) == total, (
+        f"listRegistrationInGallery for '{gallery_name}' returned {len(members)} "
+        f"registration code(s) across {page} page(s) but totalRecords={total}"
+    )
+    return members
+
+
+def galleries_members(api_client, gallery_names, max_workers=4):
+    """
+    Return {gallery_name: set of registration codes} for several galleries.
+
+    The listings are independent and I/O-bound, so they run on a small
+    thread pool over the shared session (pool_maxsize=16) and take about
+    one round trip instead of one per gallery. Each call runs in a copy of
+    the caller's context so --api-log still records it against the test.
+    """
+    names = list(gallery_names)
+    if not names:
+        return {}
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(names))) as pool:
+        futures = {
+            name: pool.submit(
+                contextvars.copy_context().run, gallery_members, api_client, name
+            )
+            for name in names
+        }
+        return {name: future.result() for name, future in futures.items()}
+
+
+def _new_gallery_name():
+    return f"test_gallery_{uuid.uuid4().hex[:8]}"
+
+
 @pytest.fixture
 def unique_gallery_name():
     """Generate a unique gallery name for test isolation."""
-    return f"test_gallery_{uuid.uuid4().hex[:8]}"
+    return _new_gallery_name()
 
 
-@pytest.fixture
-def registered_user(env_store):
+@pytest.fixture(scope="session")
+def registered_user(env_snapshot):
     """
     Return a registered user from .env (GALLERY_REGISTRATION_CODE, GALLERY_USERNAME,
     GALLERY_EMAIL).
@@ -48,10 +195,11 @@ def registered_user(env_store):
         pytest tests/stateful_apis/gallery/test_register_user.py::test_register_user_all_fields -v
 
     The saved data is reused across all subsequent test runs — no new user is registered.
+    .env is read once per session, so keys written during the run are picked up next run.
     """
-    reg_code = env_store.get("GALLERY_REGISTRATION_CODE")
-    username = env_store.get("GALLERY_USERNAME")
-    email = env_store.get("GALLERY_EMAIL")
+    reg_code = env_snapshot["GALLERY_REGISTRATION_CODE"]
+    username = env_snapshot["GALLERY_USERNAME"]
+    email = env_snapshot["GALLERY_EMAIL"]
 
     if not reg_code:
         pytest.skip(
@@ -60,7 +208,7 @@ def registered_user(env_store):
             "::test_register_user_all_fields -v"
         )
 
-    print(f"\n[INFO] Using existing user from .env: {username} ({reg_code})")
+    logger.info("[INFO] Using existing user from .env: %s (%s)", username, reg_code)
 
     yield {
         "username": username,
@@ -70,164 +218,310 @@ def registered_user(env_store):
     # No cleanup — user persists in the default gallery (no delete API)
 
 
-@pytest.fixture
-def custom_gallery(api_client, gallery_base_path, unique_gallery_name, env_store):
+@pytest.fixture(scope="session")
+def _gallery_cleanup():
+    """
+    Background pool for end-of-session gallery deletes.
+
+    The temp-gallery fixtures submit their deleteGallery calls here instead
+    of making them one after another in teardown; the pool is drained
+    (shutdown(wait=True)) after those fixtures are torn down, so every
+    delete has finished before the session ends.
     """
-    Provide a custom gallery for the test.
+    pool = ThreadPoolExecutor(max_workers=2)
+    yield pool
+    pool.shutdown(wait=True)
 
-    If GALLERY_NAME is set in .env (saved by test_add_gallery), that gallery is
-    used directly — no creation or deletion happens.
 
-    If GALLERY_NAME is not in .env, a fresh gallery is created for this test
-    and deleted in teardown.
+@pytest.fixture(scope="session")
+def custom_gallery(api_client_session, _gallery_cleanup):
     """
-    gallery_from_env = env_store.get("GALLERY_NAME")
+    Provide one custom gallery shared by every test in the session.
+
+    The gallery is created on first use and deleted at session end, so its
+    consumers pay a single addGallery/deleteGallery pair between them.
+    It deliberately does not reuse GALLERY_NAME from .env: test_delete_gallery
+    deletes that gallery mid-session, which would pull it out from under the
+    consumers that run after it.
+    """
+    gallery_name = _new_gallery_name()
+    response = api_client_session.http_client.post(
+        ADD_GALLERY,
+        json={"galleryName": gallery_name},
+    )
+
+    if response.status_code != 200:
+        pytest.skip(
+            f"Could not create test gallery '{gallery_name}' "
+            f"({response.status_code}): {response.text[:200]}"
+        )
 
-    if gallery_from_env:
-        print(f"\n[INFO] Using existing gallery from .env: {gallery_from_env}")
-        yield gallery_from_env
-        return  # no teardown — we did not create it
+    yield gallery_name
 
-    # No gallery in .env — create a temporary one
-    response = api_client.http_client.post(
-        f"{gallery_base_path}/addGallery",
-        json={"galleryName": unique_gallery_name},
+    _gallery_cleanup.submit(
+        api_client_session.http_client.post,
+        DELETE_GALLERY,
+        json={"galleryName": gallery_name},
+    )
+
+
+@pytest.fixture(scope="session")
+def empty_gallery(api_client_session, _gallery_cleanup):
+    """
+    Provide one empty gallery for the whole session.
+
+    Shared by the tests that need a gallery nobody is enrolled in, so each
+    of them skips its own addGallery/deleteGallery round trips. Tests must
+    never add registrations to it. Deleted once at session end.
+    """
+    gallery_name = _new_gallery_name()
+    response = api_client_session.http_client.post(
+        ADD_GALLERY,
+        json={"galleryName": gallery_name},
     )
 
     if response.status_code != 200:
         pytest.skip(
-            f"Could not create test gallery '{unique_gallery_name}' "
+            f"Could not create empty gallery '{gallery_name}' "
             f"({response.status_code}): {response.text[:200]}"
         )
 
-    yield unique_gallery_name
+    yield gallery_name
 
-    # Teardown: delete only the gallery we created
-    api_client.http_client.post(
-        f"{gallery_base_path}/deleteGallery",
-        json={"galleryName": unique_gallery_name},
+    _gallery_cleanup.submit(
+        api_client_session.http_client.post,
+        DELETE_GALLERY,
+        json={"galleryName": gallery_name},
     )
+    logger.info("[CLEANUP] Empty gallery '%s' queued for deletion", gallery_name)
 
 
-@pytest.fixture
-def registration_codes(env_store):
+@pytest.fixture(scope="session")
+def registration_codes(env_snapshot):
     """
-    Return the list of registration codes from .env (GALLERY_REGISTRATION_CODES, comma-separated).
+    Return the tuple of registration codes from .env (GALLERY_REGISTRATION_CODES, comma-separated).
 
     Run test_register_user_all_fields multiple times to accumulate at least 2 codes:
         pytest tests/stateful_apis/gallery/test_register_user.py::test_register_user_all_fields -v
 
     Skips the test if fewer than 2 codes are available (multi-user tests need at least 2).
     """
-    raw = env_store.get("GALLERY_REGISTRATION_CODES")
+    raw = env_snapshot["GALLERY_REGISTRATION_CODES"]
     if not raw:
         pytest.skip(
             "GALLERY_REGISTRATION_CODES not found in .env. "
             "Run test_register_user_all_fields at least twice to populate it."
         )
 
-    codes = [c.strip() for c in raw.split(",") if c.strip()]
+    codes = split_list(raw)
     if len(codes) < 2:
         pytest.skip(
             f"GALLERY_REGISTRATION_CODES must contain at least 2 codes for multi-user tests. "
-            f"Found: {codes}. Run test_register_user_all_fields again to add more."
+            f"Found: {list(codes)}. Run test_register_user_all_fields again to add more."
         )
 
-    print(f"\n[INFO] Using {len(codes)} registration codes from .env: {codes}")
+    logger.info("[INFO] Using %s registration codes from .env: %s", len(codes), list(codes))
     return codes
 
 
-@pytest.fixture
-def gallery_names(env_store):
+@pytest.fixture(scope="session")
+def gallery_names(env_snapshot):
     """
-    Return the list of gallery names from .env (GALLERY_NAMES, comma-separated).
+    Return the tuple of gallery names from .env (GALLERY_NAMES, comma-separated).
 
     Run test_list_gallery once to populate this key:
         pytest tests/stateful_apis/gallery/test_list_gallery.py::test_list_gallery -v
 
     Skips the test if fewer than 2 galleries are available (bulk tests need at least 2).
     """
-    raw = env_store.get("GALLERY_NAMES")
+    raw = env_snapshot["GALLERY_NAMES"]
     if not raw:
         pytest.skip(
             "GALLERY_NAMES not found in .env. "
             "Run: pytest tests/stateful_apis/gallery/test_list_gallery.py::test_list_gallery -v"
         )
 
-    names = [n.strip() for n in raw.split(",") if n.strip()]
+    names = split_list(raw)
     if len(names) < 2:
         pytest.skip(
-            f"GALLERY_NAMES must contain at least 2 galleries for bulk tests. Found: {names}"
+            f"GALLERY_NAMES must contain at least 2 galleries for bulk tests. Found: {list(names)}"
         )
 
-    print(f"\n[INFO] Using {len(names)} galleries from .env: {names}")
+    logger.info("[INFO] Using %s galleries from .env: %s", len(names), list(names))
     return names
 
 
-@pytest.fixture(autouse=True)
-def log_api_responses(api_client, request):
+# How to seed each comma-separated .env list the membership tests read from
+_SEED_COMMANDS = {
+    "GALLERY_REGISTRATION_CODES":
+        "pytest tests/stateful_apis/gallery/test_register_user.py::test_register_multiple_users -v",
+    "GALLERY_NAMES":
+        "pytest tests/stateful_apis/gallery/test_list_gallery.py::test_list_gallery -v",
+}
+
+
+def first_entry(env_snapshot, key):
     """
-    Automatically log all API requests and responses for this directory.
+    Return the first entry of a comma-separated .env snapshot value.
 
-    - Attaches per-call request/response JSON to Allure.
-    - Collects every transaction into request.node._api_transactions so the
-      pytest_runtest_makereport hookwrapper can write the artifact JSON file.
-    - Attaches a consolidated transaction summary to Allure after the test.
+    Skips the calling test, with the command that seeds the key, when the
+    list is missing or empty.
     """
-    if not hasattr(request.node, "_api_transactions"):
-        request.node._api_transactions = []
+    items = split_list(env_snapshot[key])
+    if not items:
+        pytest.skip(f"{key} not found in .env. Run: {_SEED_COMMANDS[key]}")
+    return items[0]
+
+
+@pytest.fixture(scope="module")
+def gallery_first(env_snapshot):
+    """
+    Return the first .env registration code and gallery name for membership tests.
+
+    Resolved once per module; skips when either list has not been seeded
+    (see first_entry).
+    """
+    return SimpleNamespace(
+        reg_code=first_entry(env_snapshot, "GALLERY_REGISTRATION_CODES"),
+        gallery_name=first_entry(env_snapshot, "GALLERY_NAMES"),
+    )
+
+
+def _noop(*args, **kwargs):
+    """Stand-in for logger.info/allure.attach when that output is disabled."""
+
+
+_RULE = "=" * 80
+_EMPTY_BODY = "(empty response body — server returned no content)"
+
+
+def _is_json(response):
+    """True when the response declares a JSON body."""
+    return "json" in response.headers.get("content-type", "")
+
+
+def _preview(response, limit):
+    """Decode at most `limit` bytes of the body for display."""
+    return response.content[:limit].decode("utf-8", "replace").strip() or _EMPTY_BODY
+
 
-    original_post = api_client.http_client.post
-    original_get = api_client.http_client.get
-
-    def logged_post(url, **kwargs):
-        print(f"\n{'='*80}")
-        print(f"[>>] POST {url}")
-
-        log_payload = None
-        if "json" in kwargs:
-            log_payload = copy.deepcopy(kwargs["json"])
-            # Truncate long base64 image fields for readability
-            for field in ("image",):
-                if field in log_payload and isinstance(log_payload[field], str) and len(log_payload[field]) > 100:
-                    log_payload[field] = f"{log_payload[field][:50]}... (truncated, length: {len(log_payload[field])})"
-
-            print("[RQ] Request Body:")
-            print(json.dumps(log_payload, indent=2))
-            allure.attach(
-                json.dumps(log_payload, indent=2),
-                name=f"Request POST {url}",
+# Node of the gallery test currently running; None outside gallery tests
+_CURRENT_NODE = contextvars.ContextVar("gallery_api_log_node", default=None)
+
+
+def _request_payload(sent):
+    """Parse the JSON body already sent, with a long base64 image truncated."""
+    if not sent.body:
+        return None
+    try:
+        payload = loads(sent.body)
+    except ValueError:
+        return None
+    # Truncate long base64 image fields for readability
+    img = payload.get("image") if isinstance(payload, dict) else None
+    if isinstance(img, str) and len(img) > 100:
+        payload["image"] = f"{img[:50]}... (truncated, length: {len(img)})"
+    return payload
+
+
+@pytest.fixture(scope="package")
+def _api_log_hook(request):
+    """
+    Install one response hook on the shared requests session to log gallery
+    API traffic.
+
+    The hook records into the node published in _CURRENT_NODE; responses
+    that arrive while no gallery test is running are ignored. It is removed
+    when the directory's tests finish.
+
+    Yields the attach callable for the per-test summary (allure.attach, or a
+    no-op when Allure is inactive), or None when logging is disabled (no
+    --api-log and AUTQA_API_LOG unset).
+    """
+    if not request.config._autqa_api_log:
+        yield None
+        return
+
+    # Attachments are only kept when allure-pytest is writing results
+    allure_active = bool(request.config.getoption("--alluredir", default=None))
+    attach = allure.attach if allure_active else _noop
+
+    def log_response(response, *args, **kwargs):
+        """requests response hook: log and record one request/response pair."""
+        node = _CURRENT_NODE.get()
+        if node is None:
+            return
+        # requests-cache's CachedSession runs response hooks a second time
+        # on uncached responses; record each response once
+        if getattr(response, "_autqa_logged", False):
+            return
+        response._autqa_logged = True
+
+        # Log level is applied per test phase, so check it on each call
+        log = logger.info if logger.isEnabledFor(logging.INFO) else _noop
+        render = allure_active or log is not _noop
+
+        sent = response.request
+        method, url = sent.method, sent.url
+        elapsed = response.elapsed.total_seconds()
+        log(_RULE)
+        log("[>>] %s %s", method, url)
+
+        log_payload = _request_payload(sent)
+        if log_payload is not None and render:
+            req_text = dumps(log_payload, indent=True)
+            log("[RQ] Request Body:")
+            log(req_text)
+            attach(
+                req_text,
+                name=f"Request {method} {url}",
                 attachment_type=allure.attachment_type.JSON,
             )
 
-        start = time.time()
-        response = original_post(url, **kwargs)
-        elapsed = time.time() - start
-
-        print(f"\n[RS] Response Status: {response.status_code}  [{elapsed:.3f}s]")
+        log("[RS] Response Status: %s  [%.3fs]", response.status_code, elapsed)
         response_body = None
-        try:
-            response_body = response.json()
-            print("[RS] Response Body:")
-            print(json.dumps(response_body, indent=2))
-            allure.attach(
-                json.dumps(response_body, indent=2),
-                name=f"Response {response.status_code} [{elapsed:.3f}s]",
-                attachment_type=allure.attachment_type.JSON,
+        parsed = False
+        if _is_json(response):
+            try:
+                response_body = response_json(response)
+                parsed = True
+            except ValueError:
+                pass
+
+        if method == "GET":
+            display = _preview(response, 1000)
+            log("[RS] Response: %s", display)
+            if not parsed and response.content:
+                response_body = display
+            # Attach the raw bytes as-is rather than decoding the whole body
+            attach(
+                response.content or display,
+                name=f"Response GET {url} {response.status_code} [{elapsed:.3f}s]",
+                attachment_type=allure.attachment_type.TEXT,
             )
-        except Exception:
-            raw = response.text.strip()
-            response_body = raw or None
-            display = raw if raw else "(empty response body — server returned no content)"
-            print(f"[RS] Response: {display[:500]}")
-            allure.attach(
+        elif parsed:
+            if render:
+                resp_text = dumps(response_body, indent=True)
+                log("[RS] Response Body:")
+                log(resp_text)
+                attach(
+                    resp_text,
+                    name=f"Response {response.status_code} [{elapsed:.3f}s]",
+                    attachment_type=allure.attachment_type.JSON,
+                )
+        else:
+            # Non-JSON bodies (error pages, empty bodies) are only kept as a preview
+            display = _preview(response, 500)
+            response_body = display if response.content else None
+            log("[RS] Response: %s", display)
+            attach(
                 display,
                 name=f"Response {response.status_code} [{elapsed:.3f}s]",
                 attachment_type=allure.attachment_type.TEXT,
             )
 
-        request.node._api_transactions.append({
-            "method": "POST",
+        node._api_transactions.append({
+            "method": method,
             "url": url,
             "request_body": log_payload,
             "response_status": response.status_code,
@@ -235,63 +529,63 @@ def log_api_responses(api_client, request):
             "elapsed_ms": round(elapsed * 1000, 2),
         })
 
-        print(f"{'='*80}\n")
-        return response
+        log(_RULE)
 
-    def logged_get(url, **kwargs):
-        print(f"\n{'='*80}")
-        print(f"[>>] GET {url}")
+    hooks = get_session().hooks["response"]
+    hooks.append(log_response)
 
-        start = time.time()
-        response = original_get(url, **kwargs)
-        elapsed = time.time() - start
+    yield attach
 
-        raw = response.text.strip()
-        display = raw if raw else "(empty response body — server returned no content)"
-        print(f"[RS] Response Status: {response.status_code}  [{elapsed:.3f}s]")
-        print(f"[RS] Response: {display[:1000]}")
+    hooks.remove(log_response)
 
-        response_body = None
-        try:
-            response_body = response.json()
-        except Exception:
-            response_body = raw or None
-
-        allure.attach(
-            display,
-            name=f"Response GET {url} {response.status_code} [{elapsed:.3f}s]",
-            attachment_type=allure.attachment_type.TEXT,
-        )
 
-        request.node._api_transactions.append({
-            "method": "GET",
-            "url": url,
-            "request_body": None,
-            "response_status": response.status_code,
-            "response_body": response_body,
-            "elapsed_ms": round(elapsed * 1000, 2),
-        })
+@pytest.fixture(autouse=True)
+def log_api_responses(_api_log_hook, request):
+    """
+    Automatically log all API requests and responses for this directory.
 
-        print(f"{'='*80}\n")
-        return response
+    - Attaches per-call request/response JSON to Allure.
+    - Collects every transaction into request.node._api_transactions so the
+      pytest_runtest_makereport hookwrapper can write the artifact JSON file.
+    - Attaches a compact transaction summary (method, URL, status, timing)
+      to Allure after the test; bodies are only in the per-call attachments.
 
-    api_client.http_client.post = logged_post
-    api_client.http_client.get = logged_get
+    Disabled unless --api-log is passed or AUTQA_API_LOG=1 is set. The
+    session response hook itself is installed once by _api_log_hook; this
+    fixture only points it at the current test.
+    """
+    attach = _api_log_hook
+    if attach is None:
+        yield
+        return
 
-    yield
+    if not hasattr(request.node, "_api_transactions"):
+        request.node._api_transactions = []
 
-    api_client.http_client.post = original_post
-    api_client.http_client.get = original_get
+    _CURRENT_NODE.set(request.node)
+    try:
+        yield
+    finally:
+        _CURRENT_NODE.set(None)
 
     # Attach consolidated transaction summary to Allure
-    if request.node._api_transactions:
+    transactions = request.node._api_transactions
+    if attach is allure.attach and transactions:
         summary = {
             "test": request.node.nodeid,
-            "transaction_count": len(request.node._api_transactions),
-            "transactions": request.node._api_transactions,
+            "transaction_count": len(transactions),
+            "transactions": [
+                {
+                    "method": t["method"],
+                    "url": t["url"],
+                    "response_status": t["response_status"],
+                    "elapsed_ms": t["elapsed_ms"],
+                }
+                for t in transactions
+            ],
         }
-        allure.attach(
-            json.dumps(summary, indent=2),
+        attach(
+            dumps(summary, indent=True),
             name="API Transaction Summary",
             attachment_type=allure.attachment_type.JSON,
         )
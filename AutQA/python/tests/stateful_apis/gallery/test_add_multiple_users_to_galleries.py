@@ -10,9 +10,14 @@ Prerequisites (run once, or multiple times to accumulate data):
        (Populates GALLERY_NAMES with all system galleries)
 """
 
+import logging
 import allure
 import pytest
 
+from .conftest import ADD_REGISTRATIONS_TO_GALLERIES, galleries_members
+
+logger = logging.getLogger(__name__)
+
 
 @allure.feature("Gallery API")
 @allure.story("Gallery Membership")
@@ -21,16 +26,18 @@ import pytest
 @allure.description(
     "Uses addRegistrationsToGalleries to add all accumulated users (GALLERY_REGISTRATION_CODES) "
     "to all galleries (GALLERY_NAMES) in a single API call. "
-    "Expects HTTP 200. Requires at least 2 registration codes and 2 galleries in .env."
+    "Expects HTTP 200, then checks every user is listed in every gallery "
+    "(one listRegistrationInGallery call per gallery, issued concurrently). Requires at least 2 registration codes and 2 galleries in .env."
 )
 @pytest.mark.stateful
 @pytest.mark.gallery
+@pytest.mark.xdist_group("gallery_membership")
 def test_add_multiple_users_to_multiple_galleries(
-    api_client, gallery_base_path, registration_codes, gallery_names
+    api_client, registration_codes, gallery_names
 ):
     """Bulk add: all stored users to all stored galleries in one request."""
     response = api_client.http_client.post(
-        f"{gallery_base_path}/addRegistrationsToGalleries",
+        ADD_REGISTRATIONS_TO_GALLERIES,
         json={
             "galleryNames": gallery_names,
             "registrationCodes": registration_codes,
@@ -38,13 +45,18 @@ def test_add_multiple_users_to_multiple_galleries(
     )
 
     assert response.status_code == 200, (
-        f"Expected 200, got {response.status_code}. Response: {response.text}"
+        f"Expected 200, got {response.status_code}. Response: {response.text[:200]}"
     )
 
-    print(f"\n[OK] Bulk add: {len(registration_codes)} users → {len(gallery_names)} galleries")
-    print(f"     Galleries ({len(gallery_names)}):")
+    # Verify with one listing per gallery instead of one check per user
+    for name, members in galleries_members(api_client, gallery_names).items():
+        missing = set(registration_codes) - members
+        assert not missing, f"Users {sorted(missing)} not listed in gallery '{name}' after bulk add"
+
+    logger.info("[OK] Bulk add: %s users → %s galleries", len(registration_codes), len(gallery_names))
+    logger.info("     Galleries (%s):", len(gallery_names))
     for name in gallery_names:
-        print(f"       - {name}")
-    print(f"     Registration codes ({len(registration_codes)}):")
+        logger.info("       - %s", name)
+    logger.info("     Registration codes (%s):", len(registration_codes))
     for code in registration_codes:
-        print(f"       - {code}")
+        logger.info("       - %s", code)
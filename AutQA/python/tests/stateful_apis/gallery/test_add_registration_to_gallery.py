@@ -4,17 +4,15 @@ Tests for POST /onboarding/gallery/addRegistrationToGallery
 Adds a registered user (by registrationCode) to a custom gallery.
 """
 
+import logging
 import allure
 import pytest
 
+from autqa.utils.json_utils import response_json
 
-def _assert_error_body(result):
-    """Assert standard Gallery API error format: {errorCode, errorMsg, status, timestamp}."""
-    assert "errorCode" in result, f"Expected 'errorCode' in error response, got: {result}"
-    assert "errorMsg" in result, f"Expected 'errorMsg' in error response, got: {result}"
-    assert "status" in result, f"Expected 'status' in error response, got: {result}"
-    assert "timestamp" in result, f"Expected 'timestamp' in error response, got: {result}"
-    print(f"\n[OK] Error - errorCode: {result['errorCode']}, errorMsg: {result['errorMsg']}")
+from .conftest import ADD_REGISTRATION_TO_GALLERY, IS_REGISTRATION_IN_GALLERY
+
+logger = logging.getLogger(__name__)
 
 
 @allure.feature("Gallery API")
@@ -27,10 +25,11 @@ def _assert_error_body(result):
 )
 @pytest.mark.stateful
 @pytest.mark.gallery
-def test_add_registration_to_gallery(api_client, gallery_base_path, registered_user, custom_gallery):
+@pytest.mark.xdist_group("gallery_membership")
+def test_add_registration_to_gallery(api_client, registered_user, custom_gallery):
     """Add a registered user to a custom gallery."""
     response = api_client.http_client.post(
-        f"{gallery_base_path}/addRegistrationToGallery",
+        ADD_REGISTRATION_TO_GALLERY,
         json={
             "galleryName": custom_gallery,
             "registrationCode": registered_user["registrationCode"],
@@ -38,44 +37,18 @@ def test_add_registration_to_gallery(api_client, gallery_base_path, registered_u
     )
 
     assert response.status_code == 200, (
-        f"Expected 200, got {response.status_code}. Response: {response.text}"
+        f"Expected 200, got {response.status_code}. Response: {response.text[:200]}"
     )
 
     # Verify
     check = api_client.http_client.post(
-        f"{gallery_base_path}/isRegistrationInGallery",
+        IS_REGISTRATION_IN_GALLERY,
         json={
             "galleryName": custom_gallery,
             "registrationCode": registered_user["registrationCode"],
         },
     )
     assert check.status_code == 200
-    assert check.json().get("exist") is True, "User should be present in gallery after adding"
-
-    print(f"\n[OK] User {registered_user['registrationCode']} added to '{custom_gallery}'")
-
-
-@allure.feature("Gallery API")
-@allure.story("Gallery Membership - Negative")
-@allure.title("addRegistrationToGallery rejects request with missing galleryName")
-@allure.severity(allure.severity_level.NORMAL)
-@allure.description(
-    "Sends addRegistrationToGallery without the required 'galleryName'. "
-    "Expects HTTP 400 or 500 and a structured error response."
-)
-@pytest.mark.stateful
-@pytest.mark.gallery
-def test_add_registration_to_gallery_missing_name(api_client, gallery_base_path, registered_user):
-    """Negative: missing galleryName."""
-    response = api_client.http_client.post(
-        f"{gallery_base_path}/addRegistrationToGallery",
-        json={"registrationCode": registered_user["registrationCode"]},
-    )
+    assert response_json(check).get("exist") is True, "User should be present in gallery after adding"
 
-    assert response.status_code in [400, 500], (
-        f"Expected 400 or 500, got {response.status_code}"
-    )
-    try:
-        _assert_error_body(response.json())
-    except (ValueError, AssertionError) as e:
-        print(f"[INFO] Error body validation skipped: {e}")
+    logger.info("[OK] User %s added to '%s'", registered_user['registrationCode'], custom_gallery)
@@ -8,9 +8,14 @@ Prerequisites (run once to populate .env):
     2. pytest tests/stateful_apis/gallery/test_list_gallery.py::test_list_gallery -v
 """
 
+import logging
 import allure
 import pytest
 
+from .conftest import ADD_REGISTRATIONS_TO_GALLERIES
+
+logger = logging.getLogger(__name__)
+
 
 @allure.feature("Gallery API")
 @allure.story("Gallery Membership")
@@ -23,12 +28,13 @@ import pytest
 )
 @pytest.mark.stateful
 @pytest.mark.gallery
-def test_add_registrations_to_galleries_bulk(api_client, gallery_base_path, registered_user, gallery_names):
+@pytest.mark.xdist_group("gallery_membership")
+def test_add_registrations_to_galleries_bulk(api_client, registered_user, gallery_names):
     """Bulk add: one user to all galleries from .env (GALLERY_NAMES)."""
     reg_code = registered_user["registrationCode"]
 
     response = api_client.http_client.post(
-        f"{gallery_base_path}/addRegistrationsToGalleries",
+        ADD_REGISTRATIONS_TO_GALLERIES,
         json={
             "galleryNames": gallery_names,
             "registrationCodes": [reg_code],
@@ -36,9 +42,9 @@ def test_add_registrations_to_galleries_bulk(api_client, gallery_base_path, regi
     )
 
     assert response.status_code == 200, (
-        f"Expected 200, got {response.status_code}. Response: {response.text}"
+        f"Expected 200, got {response.status_code}. Response: {response.text[:200]}"
     )
 
-    print(f"\n[OK] Bulk add: user {reg_code} added to {len(gallery_names)} galleries:")
+    logger.info("[OK] Bulk add: user %s added to %s galleries:", reg_code, len(gallery_names))
     for name in gallery_names:
-        print(f"     - {name}")
+        logger.info("     - %s", name)
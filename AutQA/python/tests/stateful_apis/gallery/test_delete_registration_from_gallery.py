@@ -13,9 +13,16 @@ Prerequisites (run once to populate .env):
        (Ensures the user is already in the gallery before deleting)
 """
 
+import logging
 import allure
 import pytest
 
+from autqa.utils.json_utils import response_json
+
+from .conftest import DELETE_REGISTRATION_FROM_GALLERY, IS_REGISTRATION_IN_GALLERY
+
+logger = logging.getLogger(__name__)
+
 
 @allure.feature("Gallery API")
 @allure.story("Gallery Membership")
@@ -28,43 +35,30 @@ import pytest
 )
 @pytest.mark.stateful
 @pytest.mark.gallery
-def test_delete_registration_from_gallery(api_client, gallery_base_path, env_store):
+@pytest.mark.xdist_group("gallery_membership")
+def test_delete_registration_from_gallery(api_client, gallery_first):
     """Remove one user (first from .env list) from one gallery (first from .env list)."""
-    raw_codes = env_store.get("GALLERY_REGISTRATION_CODES")
-    if not raw_codes:
-        pytest.skip(
-            "GALLERY_REGISTRATION_CODES not found in .env. "
-            "Run: pytest tests/stateful_apis/gallery/test_register_user.py"
-            "::test_register_user_all_fields -v"
-        )
-    raw_galleries = env_store.get("GALLERY_NAMES")
-    if not raw_galleries:
-        pytest.skip(
-            "GALLERY_NAMES not found in .env. "
-            "Run: pytest tests/stateful_apis/gallery/test_list_gallery.py::test_list_gallery -v"
-        )
-
-    reg_code = [c.strip() for c in raw_codes.split(",") if c.strip()][0]
-    gallery_name = [g.strip() for g in raw_galleries.split(",") if g.strip()][0]
+    reg_code = gallery_first.reg_code
+    gallery_name = gallery_first.gallery_name
 
-    print(f"\n[INFO] Deleting user {reg_code} from gallery '{gallery_name}'")
+    logger.info("[INFO] Deleting user %s from gallery '%s'", reg_code, gallery_name)
 
     # Delete
     del_resp = api_client.http_client.post(
-        f"{gallery_base_path}/deleteRegistrationFromGallery",
+        DELETE_REGISTRATION_FROM_GALLERY,
         json={"galleryName": gallery_name, "registrationCode": reg_code},
     )
     assert del_resp.status_code == 200, (
         f"Expected 200 for deleteRegistrationFromGallery, got {del_resp.status_code}. "
-        f"Response: {del_resp.text}"
+        f"Response: {del_resp.text[:200]}"
     )
 
     # Verify absence
     check = api_client.http_client.post(
-        f"{gallery_base_path}/isRegistrationInGallery",
+        IS_REGISTRATION_IN_GALLERY,
         json={"galleryName": gallery_name, "registrationCode": reg_code},
     )
     if check.status_code == 200:
-        assert check.json().get("exist") is False, "User should NOT be present after deletion"
+        assert response_json(check).get("exist") is False, "User should NOT be present after deletion"
 
-    print(f"\n[OK] User {reg_code} removed from '{gallery_name}'")
+    logger.info("[OK] User %s removed from '%s'", reg_code, gallery_name)
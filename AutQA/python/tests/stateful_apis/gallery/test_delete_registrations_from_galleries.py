@@ -12,9 +12,14 @@ Prerequisites (run once to populate .env):
        (To ensure all users are in all galleries before bulk-deleting)
 """
 
+import logging
 import allure
 import pytest
 
+from .conftest import DELETE_REGISTRATIONS_FROM_GALLERIES
+
+logger = logging.getLogger(__name__)
+
 
 @allure.feature("Gallery API")
 @allure.story("Gallery Membership")
@@ -27,12 +32,13 @@ import pytest
 )
 @pytest.mark.stateful
 @pytest.mark.gallery
+@pytest.mark.xdist_group("gallery_membership")
 def test_delete_registrations_from_galleries_bulk(
-    api_client, gallery_base_path, registration_codes, gallery_names
+    api_client, registration_codes, gallery_names
 ):
     """Bulk delete: remove all stored users from all stored galleries."""
     response = api_client.http_client.post(
-        f"{gallery_base_path}/deleteRegistrationsFromGalleries",
+        DELETE_REGISTRATIONS_FROM_GALLERIES,
         json={
             "galleryNames": gallery_names,
             "registrationCodes": registration_codes,
@@ -40,13 +46,13 @@ def test_delete_registrations_from_galleries_bulk(
     )
 
     assert response.status_code == 200, (
-        f"Expected 200, got {response.status_code}. Response: {response.text}"
+        f"Expected 200, got {response.status_code}. Response: {response.text[:200]}"
     )
 
-    print(f"\n[OK] Bulk delete: {len(registration_codes)} users removed from {len(gallery_names)} galleries")
-    print(f"     Galleries ({len(gallery_names)}):")
+    logger.info("[OK] Bulk delete: %s users removed from %s galleries", len(registration_codes), len(gallery_names))
+    logger.info("     Galleries (%s):", len(gallery_names))
     for name in gallery_names:
-        print(f"       - {name}")
-    print(f"     Registration codes ({len(registration_codes)}):")
+        logger.info("       - %s", name)
+    logger.info("     Registration codes (%s):", len(registration_codes))
     for code in registration_codes:
-        print(f"       - {code}")
+        logger.info("       - %s", code)
@@ -4,9 +4,16 @@ Tests for GET /onboarding/gallery/listGallery
 Lists all galleries configured in the system (default + any custom galleries).
 """
 
+import logging
 import allure
 import pytest
 
+from autqa.utils.json_utils import response_json
+
+from .conftest import LIST_GALLERY
+
+logger = logging.getLogger(__name__)
+
 
 @allure.feature("Gallery API")
 @allure.story("Gallery Management")
@@ -18,20 +25,21 @@ import pytest
 )
 @pytest.mark.stateful
 @pytest.mark.gallery
-def test_list_gallery(api_client, gallery_base_path, env_store):
+@pytest.mark.xdist_group("gallery_env")
+def test_list_gallery(api_client, env_store, env_snapshot):
     """listGallery returns HTTP 200 and a non-empty list. Saves all gallery names to .env."""
-    response = api_client.http_client.get(f"{gallery_base_path}/listGallery")
+    response = api_client.http_client.get(LIST_GALLERY)
 
     assert response.status_code == 200, (
-        f"Expected 200, got {response.status_code}. Response: {response.text}"
+        f"Expected 200, got {response.status_code}. Response: {response.text[:200]}"
     )
 
-    result = response.json()
+    result = response_json(response)
     assert "list" in result, f"Expected 'list' in response, got: {result}"
     assert isinstance(result["list"], list), "'list' should be an array"
 
     all_names = [g.get("galleryName", g) for g in result["list"]]
-    print(f"\n[OK] Galleries found ({len(all_names)}): {all_names}")
+    logger.info("[OK] Galleries found (%s): %s", len(all_names), all_names)
 
     # Save only custom galleries to .env — exclude the default system gallery
     # which does not support deleteRegistrationFromGallery / deleteGallery.
@@ -39,7 +47,8 @@ def test_list_gallery(api_client, gallery_base_path, env_store):
     if custom_names:
         trimmed = custom_names[-10:]
         env_store.set("GALLERY_NAMES", ",".join(trimmed))
-        print(f"\n[SAVED] GALLERY_NAMES={','.join(trimmed)}  ({len(trimmed)}/10)")
+        env_snapshot["GALLERY_NAMES"] = ",".join(trimmed)
+        logger.info("[SAVED] GALLERY_NAMES=%s  (%s/10)", ','.join(trimmed), len(trimmed))
 
     allure.attach(
         "\n".join(all_names),
@@ -54,23 +63,23 @@ def test_list_gallery(api_client, gallery_base_path, env_store):
 @allure.severity(allure.severity_level.NORMAL)
 @allure.description(
     "Creates a custom gallery and verifies it appears in the listGallery response. "
-    "Gallery is deleted in teardown via the custom_gallery fixture."
+    "The session-scoped custom_gallery fixture deletes it at session end."
 )
 @pytest.mark.stateful
 @pytest.mark.gallery
-def test_list_gallery_includes_custom_gallery(api_client, gallery_base_path, custom_gallery):
+def test_list_gallery_includes_custom_gallery(api_client, custom_gallery):
     """Custom gallery appears in the list after creation."""
-    response = api_client.http_client.get(f"{gallery_base_path}/listGallery")
+    response = api_client.http_client.get(LIST_GALLERY)
 
     assert response.status_code == 200, (
-        f"Expected 200, got {response.status_code}. Response: {response.text}"
+        f"Expected 200, got {response.status_code}. Response: {response.text[:200]}"
     )
 
-    result = response.json()
-    gallery_names = [g.get("galleryName", g) for g in result.get("list", [])]
+    result = response_json(response)
+    gallery_names = frozenset(g.get("galleryName", g) for g in result.get("list", ()))
 
     assert custom_gallery in gallery_names, (
-        f"Expected '{custom_gallery}' in gallery list, got: {gallery_names}"
+        f"Expected '{custom_gallery}' in gallery list, got: {sorted(gallery_names)}"
     )
 
-    print(f"\n[OK] Custom gallery '{custom_gallery}' found in list")
+    logger.info("[OK] Custom gallery '%s' found in list", custom_gallery)
@@ -12,9 +12,16 @@ Prerequisites (run once to populate .env):
        (Ensures the users are already enrolled in the galleries)
 """
 
+import logging
 import allure
 import pytest
 
+from autqa.utils.json_utils import response_json
+
+from .conftest import LIST_GALLERY_OF_REGISTRATION
+
+logger = logging.getLogger(__name__)
+
 
 @allure.feature("Gallery API")
 @allure.story("Gallery Membership")
@@ -28,40 +35,29 @@ import pytest
 )
 @pytest.mark.stateful
 @pytest.mark.gallery
-def test_list_gallery_of_registration(api_client, gallery_base_path, env_store):
+@pytest.mark.xdist_group("gallery_membership")
+def test_list_gallery_of_registration(api_client, gallery_first):
     """listGalleryOfRegistration includes the gallery the user was enrolled in (from .env)."""
-    raw_codes = env_store.get("GALLERY_REGISTRATION_CODES")
-    if not raw_codes:
-        pytest.skip(
-            "GALLERY_REGISTRATION_CODES not found in .env. "
-            "Run: pytest tests/stateful_apis/gallery/test_register_user.py"
-            "::test_register_multiple_users -v"
-        )
-    raw_galleries = env_store.get("GALLERY_NAMES")
-    if not raw_galleries:
-        pytest.skip(
-            "GALLERY_NAMES not found in .env. "
-            "Run: pytest tests/stateful_apis/gallery/test_list_gallery.py::test_list_gallery -v"
-        )
-
-    reg_code = [c.strip() for c in raw_codes.split(",") if c.strip()][0]
-    expected_gallery = [g.strip() for g in raw_galleries.split(",") if g.strip()][0]
+    reg_code = gallery_first.reg_code
+    expected_gallery = gallery_first.gallery_name
 
-    print(f"\n[INFO] Listing galleries for {reg_code}, expecting '{expected_gallery}'")
+    logger.info("[INFO] Listing galleries for %s, expecting '%s'", reg_code, expected_gallery)
 
     response = api_client.http_client.post(
-        f"{gallery_base_path}/listGalleryOfRegistration",
+        LIST_GALLERY_OF_REGISTRATION,
         json={"registrationCode": reg_code},
     )
 
     assert response.status_code == 200, (
-        f"Expected 200, got {response.status_code}. Response: {response.text}"
+        f"Expected 200, got {response.status_code}. Response: {response.text[:200]}"
     )
 
-    result = response.json()
+    result = response_json(response)
     assert "list" in result, f"Expected 'list' in response, got: {result}"
-    assert expected_gallery in result["list"], (
+    # Entries may be plain names or objects carrying galleryName
+    gallery_names = [g.get("galleryName", g) if isinstance(g, dict) else g for g in result["list"]]
+    assert expected_gallery in gallery_names, (
         f"Expected '{expected_gallery}' in gallery list: {result['list']}"
     )
 
-    print(f"\n[OK] User {reg_code} is in galleries: {result['list']}")
+    logger.info("[OK] User %s is in galleries: %s", reg_code, result['list'])
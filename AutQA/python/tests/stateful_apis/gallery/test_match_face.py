@@ -18,21 +18,34 @@ Prerequisites (run once to populate .env):
        (Ensures users are enrolled in the custom galleries)
 """
 
-import uuid
+import functools
+import logging
 import allure
 import pytest
 
+from autqa.utils.json_utils import response_json
+
+from .conftest import MATCH_FACE, first_entry
+
+logger = logging.getLogger(__name__)
+
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
-def _img(env_store, key: str):
-    """Read and normalise a base64 image from .env. Returns None if absent."""
-    val = env_store.get(key)
+@functools.lru_cache(maxsize=16)
+def _normalise(val: str) -> str:
+    """Strip a data: URI prefix from a base64 image (memoized per value)."""
+    return val.split(",", 1)[1] if val.startswith("data:") else val
+
+
+def _img(env_snapshot, key: str):
+    """Return a normalised base64 image from the .env snapshot, or None if absent."""
+    val = env_snapshot.get(key)
     if not val:
         return None
-    return val.split(",", 1)[1] if val.startswith("data:") else val
+    return _normalise(val)
 
 
 def _assert_match_structure(result):
@@ -43,326 +56,98 @@ def _assert_match_structure(result):
     assert isinstance(result["list"], list), "list must be an array"
 
 
-def _first_code(env_store):
-    """Return the first registration code from .env, or None."""
-    raw = env_store.get("GALLERY_REGISTRATION_CODES")
-    if not raw:
-        return None
-    codes = [c.strip() for c in raw.split(",") if c.strip()]
-    return codes[0] if codes else None
-
-
-def _first_gallery(env_store):
-    """Return the first custom gallery name from .env, or None."""
-    raw = env_store.get("GALLERY_NAMES")
-    if not raw:
-        return None
-    names = [n.strip() for n in raw.split(",") if n.strip()]
-    return names[0] if names else None
-
-
 # ---------------------------------------------------------------------------
-# Group 1 — default gallery  "(default)"
+# Match matrix — image × gallery × candidateList
+#
+# candidates: "all" sends candidateList=[], "code" sends [GALLERY_REGISTRATION_CODES[0]],
+# None omits candidateList.
 # ---------------------------------------------------------------------------
 
-@allure.feature("Gallery API")
-@allure.story("1-N Face Matching — Default Gallery")
-@allure.title("matchFace FACE image — default gallery, empty candidateList")
-@allure.severity(allure.severity_level.CRITICAL)
-@allure.description(
-    "Matches the FACE image against the full default gallery (empty candidateList = no restriction). "
-    "Expects HTTP 200 and a valid response structure."
-)
-@pytest.mark.stateful
-@pytest.mark.gallery
-def test_match_face_default_face_empty_candidate_list(api_client, gallery_base_path, env_store):
-    """FACE image, default gallery, candidateList=[] (match all)."""
-    image = _img(env_store, "FACE")
-    if not image:
-        pytest.skip("FACE not found in .env")
+_MATCH_CASES = [
+    pytest.param("FACE", "all", id="face-empty-candidate-list"),
+    pytest.param("FACE", "code", id="face-with-candidate"),
+    pytest.param("SPOOF", None, id="spoof-image"),
+    pytest.param("TX_DL_FACE", None, id="tx-dl-face"),
+]
 
-    response = api_client.http_client.post(
-        f"{gallery_base_path}/matchFace",
-        json={"image": image, "candidateList": []},
-    )
 
-    assert response.status_code == 200, (
-        f"Expected 200, got {response.status_code}. Response: {response.text}"
+def _match_case(api_client, env_snapshot, image_key, candidates, gallery_name=None):
+    """Run one matchFace case and assert the response shape and candidate filter."""
+    allure.dynamic.severity(
+        allure.severity_level.CRITICAL if image_key == "FACE" else allure.severity_level.NORMAL
     )
-    _assert_match_structure(response.json())
-    print(f"\n[OK] Default gallery / FACE / empty candidateList → {response.json()['matchCount']} match(es)")
 
-
-@allure.feature("Gallery API")
-@allure.story("1-N Face Matching — Default Gallery")
-@allure.title("matchFace FACE image — default gallery, candidateList from .env")
-@allure.severity(allure.severity_level.CRITICAL)
-@allure.description(
-    "Matches the FACE image against a single registration code from GALLERY_REGISTRATION_CODES. "
-    "Expects HTTP 200 and all returned candidates to match the provided code."
-)
-@pytest.mark.stateful
-@pytest.mark.gallery
-def test_match_face_default_face_with_candidate(api_client, gallery_base_path, env_store):
-    """FACE image, default gallery, candidateList=[reg_code from .env]."""
-    image = _img(env_store, "FACE")
+    image = _img(env_snapshot, image_key)
     if not image:
-        pytest.skip("FACE not found in .env")
+        if image_key == "TX_DL_FACE":
+            pytest.skip("TX_DL_FACE not found in .env — add it to run this test")
+        pytest.skip(f"{image_key} not found in .env")
 
-    reg_code = _first_code(env_store)
-    if not reg_code:
-        pytest.skip(
-            "GALLERY_REGISTRATION_CODES not found in .env. "
-            "Run: pytest tests/stateful_apis/gallery/test_register_user.py"
-            "::test_register_multiple_users -v"
-        )
+    body = {"image": image}
+    if gallery_name:
+        body["galleryName"] = gallery_name
 
-    response = api_client.http_client.post(
-        f"{gallery_base_path}/matchFace",
-        json={"image": image, "candidateList": [reg_code]},
-    )
+    reg_code = None
+    if candidates == "code":
+        reg_code = first_entry(env_snapshot, "GALLERY_REGISTRATION_CODES")
+        body["candidateList"] = [reg_code]
+    elif candidates == "all":
+        body["candidateList"] = []
+
+    response = api_client.http_client.post(MATCH_FACE, json=body)
 
     assert response.status_code == 200, (
-        f"Expected 200, got {response.status_code}. Response: {response.text}"
+        f"Expected 200, got {response.status_code}. Response: {response.text[:200]}"
     )
-    result = response.json()
+    result = response_json(response)
     _assert_match_structure(result)
 
-    for candidate in result["list"]:
-        assert candidate.get("registrationCode") == reg_code, (
-            f"Expected only {reg_code} in result, got {candidate.get('registrationCode')}"
-        )
-
-    print(f"\n[OK] Default gallery / FACE / candidateList=[{reg_code}] → {result['matchCount']} match(es)")
-
+    if reg_code:
+        for candidate in result["list"]:
+            assert candidate.get("registrationCode") == reg_code, (
+                f"Expected only {reg_code} in result, got {candidate.get('registrationCode')}"
+            )
 
-@allure.feature("Gallery API")
-@allure.story("1-N Face Matching — Default Gallery")
-@allure.title("matchFace SPOOF image — default gallery")
-@allure.severity(allure.severity_level.NORMAL)
-@allure.description(
-    "Matches the SPOOF image against the default gallery. "
-    "Expects HTTP 200 and a valid response structure. "
-    "Score results are logged but not strictly asserted (server threshold may vary)."
-)
-@pytest.mark.stateful
-@pytest.mark.gallery
-def test_match_face_default_spoof_image(api_client, gallery_base_path, env_store):
-    """SPOOF image, default gallery."""
-    image = _img(env_store, "SPOOF")
-    if not image:
-        pytest.skip("SPOOF not found in .env")
-
-    response = api_client.http_client.post(
-        f"{gallery_base_path}/matchFace",
-        json={"image": image},
+    logger.info(
+        "[OK] %s / %s / candidateList=%s → %s match(es)",
+        gallery_name or "(default)", image_key, body.get("candidateList", "omitted"), result['matchCount'],
     )
-
-    assert response.status_code == 200, (
-        f"Expected 200, got {response.status_code}. Response: {response.text}"
-    )
-    result = response.json()
-    _assert_match_structure(result)
-    print(f"\n[OK] Default gallery / SPOOF → {result['matchCount']} match(es)")
-    if result["list"]:
+    if image_key == "SPOOF" and result["list"]:
         top = result["list"][0]
-        print(f"     Top candidate score: {top.get('scorePercent', top.get('score', 'N/A'))}%")
+        logger.info("     Top candidate score: %s%%", top.get('scorePercent', top.get('score', 'N/A')))
 
 
 @allure.feature("Gallery API")
 @allure.story("1-N Face Matching — Default Gallery")
-@allure.title("matchFace TX_DL_FACE image — default gallery")
-@allure.severity(allure.severity_level.NORMAL)
-@allure.description(
-    "Matches the TX_DL_FACE (face cropped from a TX driver's licence) against the default gallery. "
-    "Skipped if TX_DL_FACE is not present in .env. "
-    "Expects HTTP 200 and a valid response structure."
-)
-@pytest.mark.stateful
-@pytest.mark.gallery
-def test_match_face_default_tx_dl_face(api_client, gallery_base_path, env_store):
-    """TX_DL_FACE image, default gallery (skipped if key absent in .env)."""
-    image = _img(env_store, "TX_DL_FACE")
-    if not image:
-        pytest.skip("TX_DL_FACE not found in .env — add it to run this test")
-
-    response = api_client.http_client.post(
-        f"{gallery_base_path}/matchFace",
-        json={"image": image},
-    )
-
-    assert response.status_code == 200, (
-        f"Expected 200, got {response.status_code}. Response: {response.text}"
-    )
-    result = response.json()
-    _assert_match_structure(result)
-    print(f"\n[OK] Default gallery / TX_DL_FACE → {result['matchCount']} match(es)")
-
-
-# ---------------------------------------------------------------------------
-# Group 2 — custom gallery from .env  (GALLERY_NAMES[0])
-# ---------------------------------------------------------------------------
-
-@allure.feature("Gallery API")
-@allure.story("1-N Face Matching — Custom Gallery")
-@allure.title("matchFace FACE image — custom gallery, empty candidateList")
-@allure.severity(allure.severity_level.CRITICAL)
+@allure.title("matchFace {image_key} image — default gallery, candidateList: {candidates}")
 @allure.description(
-    "Matches the FACE image against the first custom gallery in GALLERY_NAMES "
-    "with an empty candidateList (match all enrolled users). "
-    "Expects HTTP 200 and a valid response structure."
+    "Matches an image from .env against the default gallery, with an empty candidateList "
+    "(match all), a registration code from GALLERY_REGISTRATION_CODES, or no candidateList. "
+    "Expects HTTP 200 and a valid response structure; with a candidate code, every returned "
+    "candidate must match it. Skipped when the image key is not in .env."
 )
 @pytest.mark.stateful
 @pytest.mark.gallery
-def test_match_face_custom_gallery_face_empty_candidate_list(api_client, gallery_base_path, env_store):
-    """FACE image, custom gallery from .env, candidateList=[]."""
-    image = _img(env_store, "FACE")
-    if not image:
-        pytest.skip("FACE not found in .env")
-
-    gallery_name = _first_gallery(env_store)
-    if not gallery_name:
-        pytest.skip(
-            "GALLERY_NAMES not found in .env. "
-            "Run: pytest tests/stateful_apis/gallery/test_list_gallery.py::test_list_gallery -v"
-        )
-
-    response = api_client.http_client.post(
-        f"{gallery_base_path}/matchFace",
-        json={"image": image, "galleryName": gallery_name, "candidateList": []},
-    )
-
-    assert response.status_code == 200, (
-        f"Expected 200, got {response.status_code}. Response: {response.text}"
-    )
-    _assert_match_structure(response.json())
-    print(f"\n[OK] Custom '{gallery_name}' / FACE / empty candidateList → {response.json()['matchCount']} match(es)")
+@pytest.mark.parametrize("image_key,candidates", _MATCH_CASES)
+def test_match_face_default(api_client, env_snapshot, image_key, candidates):
+    """matchFace against the default gallery."""
+    _match_case(api_client, env_snapshot, image_key, candidates)
 
 
 @allure.feature("Gallery API")
 @allure.story("1-N Face Matching — Custom Gallery")
-@allure.title("matchFace FACE image — custom gallery, candidateList from .env")
-@allure.severity(allure.severity_level.CRITICAL)
+@allure.title("matchFace {image_key} image — custom gallery, candidateList: {candidates}")
 @allure.description(
-    "Matches the FACE image against a specific registration code within the first custom gallery. "
-    "Expects HTTP 200 and all returned candidates to match the provided code."
+    "Same matrix as the default-gallery test, run against the first custom gallery in "
+    "GALLERY_NAMES. Expects HTTP 200 and a valid response structure."
 )
 @pytest.mark.stateful
 @pytest.mark.gallery
-def test_match_face_custom_gallery_face_with_candidate(api_client, gallery_base_path, env_store):
-    """FACE image, custom gallery from .env, candidateList=[reg_code from .env]."""
-    image = _img(env_store, "FACE")
-    if not image:
-        pytest.skip("FACE not found in .env")
-
-    gallery_name = _first_gallery(env_store)
-    if not gallery_name:
-        pytest.skip(
-            "GALLERY_NAMES not found in .env. "
-            "Run: pytest tests/stateful_apis/gallery/test_list_gallery.py::test_list_gallery -v"
-        )
-
-    reg_code = _first_code(env_store)
-    if not reg_code:
-        pytest.skip(
-            "GALLERY_REGISTRATION_CODES not found in .env. "
-            "Run: pytest tests/stateful_apis/gallery/test_register_user.py"
-            "::test_register_multiple_users -v"
-        )
-
-    response = api_client.http_client.post(
-        f"{gallery_base_path}/matchFace",
-        json={"image": image, "galleryName": gallery_name, "candidateList": [reg_code]},
-    )
-
-    assert response.status_code == 200, (
-        f"Expected 200, got {response.status_code}. Response: {response.text}"
-    )
-    result = response.json()
-    _assert_match_structure(result)
-
-    for candidate in result["list"]:
-        assert candidate.get("registrationCode") == reg_code, (
-            f"Expected only {reg_code} in result, got {candidate.get('registrationCode')}"
-        )
-
-    print(f"\n[OK] Custom '{gallery_name}' / FACE / candidateList=[{reg_code}] → {result['matchCount']} match(es)")
-
-
-@allure.feature("Gallery API")
-@allure.story("1-N Face Matching — Custom Gallery")
-@allure.title("matchFace SPOOF image — custom gallery")
-@allure.severity(allure.severity_level.NORMAL)
-@allure.description(
-    "Matches the SPOOF image against the first custom gallery in GALLERY_NAMES. "
-    "Expects HTTP 200 and a valid response structure."
-)
-@pytest.mark.stateful
-@pytest.mark.gallery
-def test_match_face_custom_gallery_spoof_image(api_client, gallery_base_path, env_store):
-    """SPOOF image, custom gallery from .env."""
-    image = _img(env_store, "SPOOF")
-    if not image:
-        pytest.skip("SPOOF not found in .env")
-
-    gallery_name = _first_gallery(env_store)
-    if not gallery_name:
-        pytest.skip(
-            "GALLERY_NAMES not found in .env. "
-            "Run: pytest tests/stateful_apis/gallery/test_list_gallery.py::test_list_gallery -v"
-        )
-
-    response = api_client.http_client.post(
-        f"{gallery_base_path}/matchFace",
-        json={"image": image, "galleryName": gallery_name},
-    )
-
-    assert response.status_code == 200, (
-        f"Expected 200, got {response.status_code}. Response: {response.text}"
-    )
-    result = response.json()
-    _assert_match_structure(result)
-    print(f"\n[OK] Custom '{gallery_name}' / SPOOF → {result['matchCount']} match(es)")
-    if result["list"]:
-        top = result["list"][0]
-        print(f"     Top candidate score: {top.get('scorePercent', top.get('score', 'N/A'))}%")
-
-
-@allure.feature("Gallery API")
-@allure.story("1-N Face Matching — Custom Gallery")
-@allure.title("matchFace TX_DL_FACE image — custom gallery")
-@allure.severity(allure.severity_level.NORMAL)
-@allure.description(
-    "Matches the TX_DL_FACE image against the first custom gallery in GALLERY_NAMES. "
-    "Skipped if TX_DL_FACE is not present in .env. "
-    "Expects HTTP 200 and a valid response structure."
-)
-@pytest.mark.stateful
-@pytest.mark.gallery
-def test_match_face_custom_gallery_tx_dl_face(api_client, gallery_base_path, env_store):
-    """TX_DL_FACE image, custom gallery from .env (skipped if key absent in .env)."""
-    image = _img(env_store, "TX_DL_FACE")
-    if not image:
-        pytest.skip("TX_DL_FACE not found in .env — add it to run this test")
-
-    gallery_name = _first_gallery(env_store)
-    if not gallery_name:
-        pytest.skip(
-            "GALLERY_NAMES not found in .env. "
-            "Run: pytest tests/stateful_apis/gallery/test_list_gallery.py::test_list_gallery -v"
-        )
-
-    response = api_client.http_client.post(
-        f"{gallery_base_path}/matchFace",
-        json={"image": image, "galleryName": gallery_name},
-    )
-
-    assert response.status_code == 200, (
-        f"Expected 200, got {response.status_code}. Response: {response.text}"
-    )
-    result = response.json()
-    _assert_match_structure(result)
-    print(f"\n[OK] Custom '{gallery_name}' / TX_DL_FACE → {result['matchCount']} match(es)")
+@pytest.mark.parametrize("image_key,candidates", _MATCH_CASES)
+def test_match_face_custom_gallery(api_client, env_snapshot, image_key, candidates):
+    """matchFace against the first custom gallery from .env."""
+    gallery_name = first_entry(env_snapshot, "GALLERY_NAMES")
+    _match_case(api_client, env_snapshot, image_key, candidates, gallery_name)
 
 
 # ---------------------------------------------------------------------------
@@ -374,52 +159,33 @@ def test_match_face_custom_gallery_tx_dl_face(api_client, gallery_base_path, env
 @allure.title("matchFace in brand-new empty gallery returns matchCount == 0")
 @allure.severity(allure.severity_level.MINOR)
 @allure.description(
-    "Creates a fresh empty gallery and performs a match against it. "
-    "Expects HTTP 200 and matchCount == 0. Temporary gallery is deleted after the test."
+    "Performs a match against the session's empty gallery. "
+    "Expects HTTP 200 and matchCount == 0."
 )
 @pytest.mark.stateful
 @pytest.mark.gallery
-def test_match_face_empty_custom_gallery(api_client, gallery_base_path, env_store):
-    """Match against a brand-new empty gallery returns zero results."""
-    image = _img(env_store, "FACE")
+def test_match_face_empty_custom_gallery(api_client, env_snapshot, empty_gallery):
+    """Match against an empty gallery returns zero results."""
+    image = _img(env_snapshot, "FACE")
     if not image:
         pytest.skip("FACE not found in .env")
 
-    fresh_gallery = f"test_gallery_{uuid.uuid4().hex[:8]}"
+    logger.info("[INFO] Matching FACE against empty gallery '%s'", empty_gallery)
+
+    response = api_client.http_client.post(
+        MATCH_FACE,
+        json={"image": image, "galleryName": empty_gallery},
+    )
 
-    create_resp = api_client.http_client.post(
-        f"{gallery_base_path}/addGallery",
-        json={"galleryName": fresh_gallery},
+    assert response.status_code == 200, (
+        f"Expected 200, got {response.status_code}. Response: {response.text[:200]}"
+    )
+    result = response_json(response)
+    assert "matchCount" in result
+    assert result["matchCount"] == 0, (
+        f"Expected 0 matches in an empty gallery, got {result['matchCount']}"
     )
-    if create_resp.status_code != 200:
-        pytest.skip(
-            f"Could not create temporary gallery '{fresh_gallery}' "
-            f"({create_resp.status_code}): {create_resp.text[:200]}"
-        )
-
-    print(f"\n[INFO] Matching FACE against fresh empty gallery '{fresh_gallery}'")
-
-    try:
-        response = api_client.http_client.post(
-            f"{gallery_base_path}/matchFace",
-            json={"image": image, "galleryName": fresh_gallery},
-        )
-
-        assert response.status_code == 200, (
-            f"Expected 200, got {response.status_code}. Response: {response.text}"
-        )
-        result = response.json()
-        assert "matchCount" in result
-        assert result["matchCount"] == 0, (
-            f"Expected 0 matches in an empty gallery, got {result['matchCount']}"
-        )
-        print(f"\n[OK] Empty gallery match returned 0 results as expected")
-    finally:
-        api_client.http_client.post(
-            f"{gallery_base_path}/deleteGallery",
-            json={"galleryName": fresh_gallery},
-        )
-        print(f"[CLEANUP] Temporary gallery '{fresh_gallery}' deleted")
+    logger.info("[OK] Empty gallery match returned 0 results as expected")
 
 
 @allure.feature("Gallery API")
@@ -432,14 +198,14 @@ def test_match_face_empty_custom_gallery(api_client, gallery_base_path, env_stor
 )
 @pytest.mark.stateful
 @pytest.mark.gallery
-def test_match_face_missing_image(api_client, gallery_base_path):
+def test_match_face_missing_image(api_client):
     """Negative: missing image field."""
     response = api_client.http_client.post(
-        f"{gallery_base_path}/matchFace",
+        MATCH_FACE,
         json={},
     )
 
     assert response.status_code in [400, 500], (
         f"Expected 400 or 500, got {response.status_code}"
     )
-    print(f"\n[OK] Missing image correctly rejected with status {response.status_code}")
+    logger.info("[OK] Missing image correctly rejected with status %s", response.status_code)
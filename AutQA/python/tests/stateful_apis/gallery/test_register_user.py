@@ -5,24 +5,25 @@ Registers a user with a face image and adds them to the default system gallery.
 Returns a registrationCode on success.
 """
 
+import contextvars
+import logging
+import secrets
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 import allure
 import pytest
 
+from autqa.utils.json_utils import response_json
+
+from .conftest import REGISTER_USER, assert_error_body
+
+logger = logging.getLogger(__name__)
+
 # Number of users to register in the bulk seed test.
 _BULK_REGISTER_COUNT = 5
 
-
-def _assert_error_body(result):
-    """Assert standard Gallery API error format: {errorCode, errorMsg, status, timestamp}."""
-    assert "errorCode" in result, f"Expected 'errorCode' in error response, got: {result}"
-    assert "errorMsg" in result, f"Expected 'errorMsg' in error response, got: {result}"
-    assert "status" in result, f"Expected 'status' in error response, got: {result}"
-    assert "timestamp" in result, f"Expected 'timestamp' in error response, got: {result}"
-    assert result["errorCode"] in ("INPUT_FORMAT_ERROR", "INPUT_VALUES_ERROR"), (
-        f"Unexpected errorCode: {result['errorCode']}"
-    )
-    print(f"\n[OK] Error response - errorCode: {result['errorCode']}, errorMsg: {result['errorMsg']}")
+# errorCode values the registerUser validation errors may return
+_INPUT_ERROR_CODES = ("INPUT_FORMAT_ERROR", "INPUT_VALUES_ERROR")
 
 
 @allure.feature("Gallery API")
@@ -35,12 +36,12 @@ def _assert_error_body(result):
 )
 @pytest.mark.stateful
 @pytest.mark.gallery
-def test_register_user_required_fields_only(api_client, gallery_base_path, gallery_face_image):
+def test_register_user_required_fields_only(api_client, gallery_face_image):
     """Register a user with only the required fields (username, email, image)."""
     username = f"gallery_req_{uuid.uuid4().hex[:8]}"
 
     response = api_client.http_client.post(
-        f"{gallery_base_path}/registerUser",
+        REGISTER_USER,
         json={
             "username": username,
             "email": f"{username}@test.aware.com",
@@ -49,15 +50,15 @@ def test_register_user_required_fields_only(api_client, gallery_base_path, galle
     )
 
     assert response.status_code == 200, (
-        f"Expected 200, got {response.status_code}. Response: {response.text}"
+        f"Expected 200, got {response.status_code}. Response: {response.text[:200]}"
     )
 
-    result = response.json()
+    result = response_json(response)
     assert "registrationCode" in result, f"Expected 'registrationCode' in response, got: {result}"
     assert result["registrationCode"], "registrationCode should not be empty"
 
-    print(f"\n[OK] User registered: {username}")
-    print(f"     Registration code: {result['registrationCode']}")
+    logger.info("[OK] User registered: %s", username)
+    logger.info("     Registration code: %s", result['registrationCode'])
 
 
 @allure.feature("Gallery API")
@@ -71,13 +72,14 @@ def test_register_user_required_fields_only(api_client, gallery_base_path, galle
 )
 @pytest.mark.stateful
 @pytest.mark.gallery
-def test_register_user_all_fields(api_client, gallery_base_path, gallery_face_image, env_store):
+@pytest.mark.xdist_group("gallery_env")
+def test_register_user_all_fields(api_client, gallery_face_image, env_store, env_snapshot):
     """Register a user with all fields and save the result to .env for reuse by other tests."""
     username = f"gallery_full_{uuid.uuid4().hex[:8]}"
     email = f"{username}@test.aware.com"
 
     response = api_client.http_client.post(
-        f"{gallery_base_path}/registerUser",
+        REGISTER_USER,
         json={
             "username": username,
             "email": email,
@@ -89,25 +91,23 @@ def test_register_user_all_fields(api_client, gallery_base_path, gallery_face_im
     )
 
     assert response.status_code == 200, (
-        f"Expected 200, got {response.status_code}. Response: {response.text}"
+        f"Expected 200, got {response.status_code}. Response: {response.text[:200]}"
     )
 
-    result = response.json()
+    result = response_json(response)
     assert "registrationCode" in result
     assert result["registrationCode"]
 
     reg_code = result["registrationCode"]
 
     # --- Rolling list: GALLERY_REGISTRATION_CODES (max 10) ---
-    raw_codes = env_store.get("GALLERY_REGISTRATION_CODES")
-    codes = [c.strip() for c in raw_codes.split(",") if c.strip()] if raw_codes else []
+    codes = list(env_store.get_list("GALLERY_REGISTRATION_CODES"))
     if reg_code not in codes:
         codes.append(reg_code)
     codes = codes[-10:]
 
     # --- Rolling list: GALLERY_USERNAMES (max 10) ---
-    raw_usernames = env_store.get("GALLERY_USERNAMES")
-    usernames_list = [u.strip() for u in raw_usernames.split(",") if u.strip()] if raw_usernames else []
+    usernames_list = list(env_store.get_list("GALLERY_USERNAMES"))
     if username not in usernames_list:
         usernames_list.append(username)
     usernames_list = usernames_list[-10:]
@@ -120,15 +120,21 @@ def test_register_user_all_fields(api_client, gallery_base_path, gallery_face_im
         "GALLERY_REGISTRATION_CODES": ",".join(codes),
         "GALLERY_USERNAMES": ",".join(usernames_list),
     })
+    env_snapshot.update({
+        "GALLERY_REGISTRATION_CODE": reg_code,
+        "GALLERY_USERNAME": username,
+        "GALLERY_EMAIL": email,
+        "GALLERY_REGISTRATION_CODES": ",".join(codes),
+    })
 
-    print(f"\n[OK] User registered with all fields: {username}")
-    print(f"     Registration code: {reg_code}")
-    print(f"\n[SAVED] Written to .env:")
-    print(f"        GALLERY_REGISTRATION_CODE={reg_code}")
-    print(f"        GALLERY_USERNAME={username}")
-    print(f"        GALLERY_EMAIL={email}")
-    print(f"        GALLERY_REGISTRATION_CODES={','.join(codes)}  ({len(codes)}/10)")
-    print(f"        GALLERY_USERNAMES={','.join(usernames_list)}  ({len(usernames_list)}/10)")
+    logger.info("[OK] User registered with all fields: %s", username)
+    logger.info("     Registration code: %s", reg_code)
+    logger.info("[SAVED] Written to .env:")
+    logger.info("        GALLERY_REGISTRATION_CODE=%s", reg_code)
+    logger.info("        GALLERY_USERNAME=%s", username)
+    logger.info("        GALLERY_EMAIL=%s", email)
+    logger.info("        GALLERY_REGISTRATION_CODES=%s  (%s/10)", ','.join(codes), len(codes))
+    logger.info("        GALLERY_USERNAMES=%s  (%s/10)", ','.join(usernames_list), len(usernames_list))
 
 
 @allure.feature("Gallery API")
@@ -141,10 +147,10 @@ def test_register_user_all_fields(api_client, gallery_base_path, gallery_face_im
 )
 @pytest.mark.stateful
 @pytest.mark.gallery
-def test_register_user_missing_username(api_client, gallery_base_path, gallery_face_image):
+def test_register_user_missing_username(api_client, gallery_face_image):
     """Negative: missing username field."""
     response = api_client.http_client.post(
-        f"{gallery_base_path}/registerUser",
+        REGISTER_USER,
         json={
             "email": "no_username@test.aware.com",
             "image": gallery_face_image,
@@ -155,9 +161,9 @@ def test_register_user_missing_username(api_client, gallery_base_path, gallery_f
         f"Expected 400 or 500, got {response.status_code}"
     )
     try:
-        _assert_error_body(response.json())
+        assert_error_body(response_json(response), _INPUT_ERROR_CODES)
     except (ValueError, AssertionError) as e:
-        print(f"[INFO] Error body validation skipped: {e}")
+        logger.info("[INFO] Error body validation skipped: %s", e)
 
 
 @allure.feature("Gallery API")
@@ -170,12 +176,12 @@ def test_register_user_missing_username(api_client, gallery_base_path, gallery_f
 )
 @pytest.mark.stateful
 @pytest.mark.gallery
-def test_register_user_missing_email(api_client, gallery_base_path, gallery_face_image):
+def test_register_user_missing_email(api_client, gallery_face_image):
     """Negative: missing email field."""
     username = f"gallery_noemail_{uuid.uuid4().hex[:8]}"
 
     response = api_client.http_client.post(
-        f"{gallery_base_path}/registerUser",
+        REGISTER_USER,
         json={
             "username": username,
             "image": gallery_face_image,
@@ -186,9 +192,9 @@ def test_register_user_missing_email(api_client, gallery_base_path, gallery_face
         f"Expected 400 or 500, got {response.status_code}"
     )
     try:
-        _assert_error_body(response.json())
+        assert_error_body(response_json(response), _INPUT_ERROR_CODES)
     except (ValueError, AssertionError) as e:
-        print(f"[INFO] Error body validation skipped: {e}")
+        logger.info("[INFO] Error body validation skipped: %s", e)
 
 
 @allure.feature("Gallery API")
@@ -201,12 +207,12 @@ def test_register_user_missing_email(api_client, gallery_base_path, gallery_face
 )
 @pytest.mark.stateful
 @pytest.mark.gallery
-def test_register_user_missing_image(api_client, gallery_base_path):
+def test_register_user_missing_image(api_client):
     """Negative: missing image field."""
     username = f"gallery_noimg_{uuid.uuid4().hex[:8]}"
 
     response = api_client.http_client.post(
-        f"{gallery_base_path}/registerUser",
+        REGISTER_USER,
         json={
             "username": username,
             "email": f"{username}@test.aware.com",
@@ -217,9 +223,9 @@ def test_register_user_missing_image(api_client, gallery_base_path):
         f"Expected 400 or 500, got {response.status_code}"
     )
     try:
-        _assert_error_body(response.json())
+        assert_error_body(response_json(response), _INPUT_ERROR_CODES)
     except (ValueError, AssertionError) as e:
-        print(f"[INFO] Error body validation skipped: {e}")
+        logger.info("[INFO] Error body validation skipped: %s", e)
 
 
 @allure.feature("Gallery API")
@@ -232,12 +238,12 @@ def test_register_user_missing_image(api_client, gallery_base_path):
 )
 @pytest.mark.stateful
 @pytest.mark.gallery
-def test_register_user_invalid_image(api_client, gallery_base_path):
+def test_register_user_invalid_image(api_client):
     """Negative: image field contains non-image base64 data."""
     username = f"gallery_badb64_{uuid.uuid4().hex[:8]}"
 
     response = api_client.http_client.post(
-        f"{gallery_base_path}/registerUser",
+        REGISTER_USER,
         json={
             "username": username,
             "email": f"{username}@test.aware.com",
@@ -248,7 +254,7 @@ def test_register_user_invalid_image(api_client, gallery_base_path):
     assert response.status_code in [400, 500], (
         f"Expected 400 or 500 for invalid image, got {response.status_code}"
     )
-    print(f"\n[OK] Invalid image correctly rejected with status {response.status_code}")
+    logger.info("[OK] Invalid image correctly rejected with status %s", response.status_code)
 
 
 @allure.feature("Gallery API")
@@ -256,48 +262,60 @@ def test_register_user_invalid_image(api_client, gallery_base_path):
 @allure.title(f"Bulk register {_BULK_REGISTER_COUNT} users and save all codes to .env")
 @allure.severity(allure.severity_level.NORMAL)
 @allure.description(
-    f"Registers {_BULK_REGISTER_COUNT} new users in sequence. "
+    f"Registers {_BULK_REGISTER_COUNT} new users concurrently. "
     "All registration codes are appended to the GALLERY_REGISTRATION_CODES rolling list "
     "and all usernames to GALLERY_USERNAMES (max 10 each). "
     "Run this test once to quickly populate .env with enough codes for bulk/delete tests."
 )
 @pytest.mark.stateful
 @pytest.mark.gallery
-def test_register_multiple_users(api_client, gallery_base_path, gallery_face_image, env_store):
+@pytest.mark.xdist_group("gallery_env")
+def test_register_multiple_users(api_client, gallery_face_image, env_store, env_snapshot):
     """Register several users at once and accumulate all codes in .env (max 10)."""
     # Load existing lists from .env
-    raw_codes = env_store.get("GALLERY_REGISTRATION_CODES")
-    codes = [c.strip() for c in raw_codes.split(",") if c.strip()] if raw_codes else []
+    codes = list(env_store.get_list("GALLERY_REGISTRATION_CODES"))
+    usernames_list = list(env_store.get_list("GALLERY_USERNAMES"))
+
+    # One RNG read for all usernames, sliced into 8-hex-char suffixes
+    token = secrets.token_hex(4 * _BULK_REGISTER_COUNT)
 
-    raw_usernames = env_store.get("GALLERY_USERNAMES")
-    usernames_list = [u.strip() for u in raw_usernames.split(",") if u.strip()] if raw_usernames else []
+    jobs = []
+    for i in range(1, _BULK_REGISTER_COUNT + 1):
+        username = f"gallery_bulk_{token[(i - 1) * 8:i * 8]}"
+        jobs.append({
+            "username": username,
+            "email": f"{username}@test.aware.com",
+            "firstName": "Bulk",
+            "lastName": f"User{i}",
+            "image": gallery_face_image,
+        })
+
+    # Registrations are independent (unique usernames), so send them together.
+    # Each call runs in a copy of this test's context so --api-log still
+    # records it against the test; results are read back in input order.
+    with ThreadPoolExecutor(max_workers=_BULK_REGISTER_COUNT) as pool:
+        futures = [
+            pool.submit(
+                contextvars.copy_context().run,
+                api_client.http_client.post, REGISTER_USER, json=job,
+            )
+            for job in jobs
+        ]
+        responses = [future.result() for future in futures]
 
     new_codes = []
     new_usernames = []
 
-    for i in range(1, _BULK_REGISTER_COUNT + 1):
-        username = f"gallery_bulk_{uuid.uuid4().hex[:8]}"
-        email = f"{username}@test.aware.com"
-
-        response = api_client.http_client.post(
-            f"{gallery_base_path}/registerUser",
-            json={
-                "username": username,
-                "email": email,
-                "firstName": "Bulk",
-                "lastName": f"User{i}",
-                "image": gallery_face_image,
-            },
-        )
-
+    for i, (job, response) in enumerate(zip(jobs, responses), start=1):
+        username = job["username"]
         assert response.status_code == 200, (
-            f"[User {i}] Expected 200, got {response.status_code}. Response: {response.text}"
+            f"[User {i}] Expected 200, got {response.status_code}. Response: {response.text[:200]}"
         )
 
-        reg_code = response.json()["registrationCode"]
+        reg_code = response_json(response)["registrationCode"]
         new_codes.append(reg_code)
         new_usernames.append(username)
-        print(f"  [{i}/{_BULK_REGISTER_COUNT}] Registered {username} → {reg_code}")
+        logger.info("  [%s/%s] Registered %s → %s", i, _BULK_REGISTER_COUNT, username, reg_code)
 
     # Merge into rolling lists (max 10)
     for code in new_codes:
@@ -316,7 +334,12 @@ def test_register_multiple_users(api_client, gallery_base_path, gallery_face_ima
         "GALLERY_REGISTRATION_CODES": ",".join(codes),
         "GALLERY_USERNAMES": ",".join(usernames_list),
     })
+    env_snapshot.update({
+        "GALLERY_REGISTRATION_CODE": new_codes[-1],
+        "GALLERY_USERNAME": new_usernames[-1],
+        "GALLERY_REGISTRATION_CODES": ",".join(codes),
+    })
 
-    print(f"\n[OK] Registered {len(new_codes)} users")
-    print(f"\n[SAVED] GALLERY_REGISTRATION_CODES={','.join(codes)}  ({len(codes)}/10)")
-    print(f"        GALLERY_USERNAMES={','.join(usernames_list)}  ({len(usernames_list)}/10)")
+    logger.info("[OK] Registered %s users", len(new_codes))
+    logger.info("[SAVED] GALLERY_REGISTRATION_CODES=%s  (%s/10)", ','.join(codes), len(codes))
+    logger.info("        GALLERY_USERNAMES=%s  (%s/10)", ','.join(usernames_list), len(usernames_list))
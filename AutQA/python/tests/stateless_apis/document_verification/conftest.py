@@ -1,9 +1,14 @@
 """
 Shared fixtures for Document Verification tests.
+
+Request/response logging is opt-in: run with --api-log or set AUTQA_API_LOG=1.
 """
 
 import pytest
-import json
+
+from client import get_session
+
+from autqa.utils.json_utils import dumps, loads, response_json
 
 
 @pytest.fixture
@@ -12,7 +17,7 @@ def doc_verification_base_path():
     return "/documentVerification"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def document_image_base64(env_store):
     """Get document front image from .env file (OCR_FRONT)."""
     # Try OCR_FRONT first (new standard)
@@ -32,7 +37,7 @@ def document_image_base64(env_store):
     return doc_b64
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def document_image_rear_base64(env_store):
     """Get document rear image from .env file (OCR_BACK)."""
     # Try OCR_BACK first (new standard)
@@ -55,7 +60,7 @@ def document_image_rear_base64(env_store):
     return doc_b64
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def face_image_base64(env_store):
     """Get face image from .env file (OCR_FACE) for biometric comparison."""
     # Try OCR_FACE first (new standard)
@@ -74,95 +79,97 @@ def face_image_base64(env_store):
     return face_b64
 
 
-@pytest.fixture(autouse=True)
-def log_api_responses(api_client):
+@pytest.fixture(scope="session")
+def front_document_image(document_image_base64):
+    """documentImage entry for the front image (lighting scheme 6, JPG). Do not mutate."""
+    return {"lightingScheme": 6, "image": document_image_base64, "format": "JPG"}
+
+
+@pytest.fixture(scope="session")
+def rear_document_image(document_image_rear_base64):
+    """documentImage entry for the rear image (lighting scheme 6, JPG). Do not mutate."""
+    return {"lightingScheme": 6, "image": document_image_rear_base64, "format": "JPG"}
+
+
+@pytest.fixture(scope="session")
+def facial_image(face_image_base64):
+    """biometricsInfo.facialImage entry for the face image. Do not mutate."""
+    return {"image": face_image_base64}
+
+
+# Strings longer than this (base64 images) are shortened in logged bodies
+_LOG_STRING_LIMIT = 1000
+
+
+def _truncate_long_strings(obj):
     """
-    Automatically log all API requests and responses.
+    Return a copy of a JSON value with long strings shortened for logging.
     
-    This fixture runs for every test in this directory (autouse=True).
+    Walks the structure once and builds new containers, so the caller's
+    payload (which is about to be sent) is never modified.
     """
-    original_post = api_client.http_client.post
-    original_get = api_client.http_client.get
-    
-    def logged_post(url, **kwargs):
-        print(f"\n{'='*80}")
-        print(f"?? POST {url}")
-        
-        if 'json' in kwargs:
-            payload = kwargs['json'].copy()
-            # Truncate long base64 strings for readability
-            if 'documentImage' in payload:
-                if 'image' in payload['documentImage']:
-                    img = payload['documentImage']['image']
-                    payload['documentImage']['image'] = f"{img[:50]}... (truncated, length: {len(img)})"
-            
-            if 'documentsInfo' in payload:
-                if 'documentImage' in payload['documentsInfo']:
-                    for doc in payload['documentsInfo']['documentImage']:
-                        if 'image' in doc:
-                            img = doc['image']
-                            doc['image'] = f"{img[:50]}... (truncated, length: {len(img)})"
-            
-            if 'biometricsInfo' in payload:
-                if 'facialImage' in payload['biometricsInfo']:
-                    if 'image' in payload['biometricsInfo']['facialImage']:
-                        img = payload['biometricsInfo']['facialImage']['image']
-                        payload['biometricsInfo']['facialImage']['image'] = f"{img[:50]}... (truncated, length: {len(img)})"
-            
-            print(f"?? Request Body:")
-            print(json.dumps(payload, indent=2))
-        
-        response = original_post(url, **kwargs)
-        
-        print(f"\n?? Response Status: {response.status_code}")
+    if isinstance(obj, str):
+        if len(obj) > _LOG_STRING_LIMIT:
+            return f"{obj[:50]}... (truncated, length: {len(obj)})"
+        return obj
+    if isinstance(obj, dict):
+        return {k: _truncate_long_strings(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [_truncate_long_strings(v) for v in obj]
+    return obj
+
+
+def _log_response(response, *args, **kwargs):
+    """requests response hook: print the request and response of one call."""
+    # requests-cache's CachedSession runs response hooks a second time on
+    # uncached responses; print each response once
+    if getattr(response, "_autqa_logged", False):
+        return
+    response._autqa_logged = True
+
+    sent = response.request
+    print(f"\n{'='*80}")
+    print(f"?? {sent.method} {sent.url}")
+    
+    if sent.body:
+        # Truncated view for the log; the body already went out unchanged
+        print(f"?? Request Body:")
         try:
-            response_data = response.json()
-            # Truncate long image fields in response
-            if 'frontImg' in response_data and response_data.get('frontImg'):
-                response_data['frontImg'] = f"{response_data['frontImg'][:50]}... (truncated)"
-            if 'rearImg' in response_data and response_data.get('rearImg'):
-                response_data['rearImg'] = f"{response_data['rearImg'][:50]}... (truncated)"
-            if 'portraitImage' in response_data and response_data.get('portraitImage'):
-                response_data['portraitImage'] = f"{response_data['portraitImage'][:50]}... (truncated)"
-            
-            # Check nested portraitImage in biometricsAuthenticationResult
-            if 'biometricsAuthenticationResult' in response_data:
-                bio = response_data['biometricsAuthenticationResult']
-                if 'portraitImage' in bio and bio.get('portraitImage'):
-                    bio['portraitImage'] = f"{bio['portraitImage'][:50]}... (truncated)"
-            
-            # Check nested portraitImage in documentAuthenticationResult
-            if 'documentAuthenticationResult' in response_data:
-                doc = response_data['documentAuthenticationResult']
-                if 'portraitImage' in doc and doc.get('portraitImage'):
-                    doc['portraitImage'] = f"{doc['portraitImage'][:50]}... (truncated)"
-                if 'signatureImage' in doc and doc.get('signatureImage'):
-                    doc['signatureImage'] = f"{doc['signatureImage'][:50]}... (truncated)"
-            
-            print(f"?? Response Body:")
-            print(json.dumps(response_data, indent=2))
-        except:
-            print(f"?? Response Text: {response.text[:500]}")
-        
-        print(f"{'='*80}\n")
-        return response
-    
-    def logged_get(url, **kwargs):
-        print(f"\n{'='*80}")
-        print(f"?? GET {url}")
-        
-        response = original_get(url, **kwargs)
-        
-        print(f"?? Response Status: {response.status_code}")
-        print(f"?? Response: {response.text}")
-        print(f"{'='*80}\n")
-        
-        return response
-    
-    api_client.http_client.post = logged_post
-    api_client.http_client.get = logged_get
+            print(dumps(_truncate_long_strings(loads(sent.body)), indent=True))
+        except ValueError:
+            body = sent.body[:500]
+            if isinstance(body, bytes):
+                body = body.decode("utf-8", errors="replace")
+            print(body)
+    
+    print(f"\n?? Response Status: {response.status_code}")
+    try:
+        response_data = response_json(response)
+        print(f"?? Response Body:")
+        print(dumps(_truncate_long_strings(response_data), indent=True))
+    except ValueError:
+        # Slice the raw bytes first so a large body is never fully decoded
+        print(f"?? Response Text: {response.content[:500].decode('utf-8', errors='replace')}")
+    
+    print(f"{'='*80}\n")
+
+
+@pytest.fixture(scope="package", autouse=True)
+def log_api_responses(request):
+    """
+    Log all API requests and responses when API logging is enabled.
+    
+    Installs one response hook on the shared requests session for the tests
+    in this directory, and only when --api-log is passed or AUTQA_API_LOG=1
+    is set, so default runs skip the per-request parsing and pretty-printing.
+    """
+    if not request.config._autqa_api_log:
+        yield
+        return
+
+    hooks = get_session().hooks["response"]
+    hooks.append(_log_response)
     
     yield
     
-    api_client.http_client.post = original_post
-    api_client.http_client.get = original_get
+    hooks.remove(_log_response)
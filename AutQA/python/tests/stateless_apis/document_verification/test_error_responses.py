@@ -2,6 +2,10 @@
 
 import pytest
 
+# Document Verification API uses INVALID_INPUT (not INPUT_FORMAT_ERROR)
+_VALID_400_CODES = frozenset({"INPUT_FORMAT_ERROR", "INPUT_VALUES_ERROR", "INVALID_INPUT"})
+_VALID_500_CODES = frozenset({"INTERNAL_SERVER_ERROR", "OCR_PROCESSING_ERROR"})
+
 
 @pytest.mark.stateless
 @pytest.mark.document_verification
@@ -28,15 +32,12 @@ def test_error_response_structure(api_client, doc_verification_base_path):
         assert isinstance(error["timestamp"], str), "timestamp must be string"
         
         if response.status_code == 400:
-            # Document Verification API uses INVALID_INPUT (not INPUT_FORMAT_ERROR)
-            valid_400_codes = ["INPUT_FORMAT_ERROR", "INPUT_VALUES_ERROR", "INVALID_INPUT"]
-            assert error["errorCode"] in valid_400_codes, (
-                f"Error code '{error['errorCode']}' not in valid 400 codes: {valid_400_codes}"
+            assert error["errorCode"] in _VALID_400_CODES, (
+                f"Error code '{error['errorCode']}' not in valid 400 codes: {sorted(_VALID_400_CODES)}"
             )
         elif response.status_code == 500:
-            valid_500_codes = ["INTERNAL_SERVER_ERROR", "OCR_PROCESSING_ERROR"]
-            assert error["errorCode"] in valid_500_codes, (
-                f"Error code '{error['errorCode']}' not in valid 500 codes: {valid_500_codes}"
+            assert error["errorCode"] in _VALID_500_CODES, (
+                f"Error code '{error['errorCode']}' not in valid 500 codes: {sorted(_VALID_500_CODES)}"
             )
         
         print(f"\n? Error response structure validated")
@@ -2,6 +2,14 @@
 
 import pytest
 
+# Document Verification uses INVALID_INPUT (not INPUT_FORMAT_ERROR)
+_VALID_ERROR_CODES = frozenset({
+    "INPUT_FORMAT_ERROR",
+    "INPUT_VALUES_ERROR",
+    "INTERNAL_SERVER_ERROR",
+    "INVALID_INPUT",
+})
+
 
 @pytest.mark.stateless
 @pytest.mark.document_verification
@@ -17,15 +25,8 @@ def test_validate_document_missing_document_image(api_client, doc_verification_b
     try:
         error = response.json()
         assert "errorCode" in error
-        # Document Verification uses INVALID_INPUT (not INPUT_FORMAT_ERROR)
-        valid_error_codes = [
-            "INPUT_FORMAT_ERROR", 
-            "INPUT_VALUES_ERROR", 
-            "INTERNAL_SERVER_ERROR",
-            "INVALID_INPUT"  # ? Added this one
-        ]
-        assert error["errorCode"] in valid_error_codes, (
-            f"Error code '{error['errorCode']}' not in valid codes: {valid_error_codes}"
+        assert error["errorCode"] in _VALID_ERROR_CODES, (
+            f"Error code '{error['errorCode']}' not in valid codes: {sorted(_VALID_ERROR_CODES)}"
         )
         print(f"\n? Proper error returned: {error['errorCode']} - {error['errorMsg']}")
     except ValueError:
@@ -1,11 +1,17 @@
 """Document and biometrics verification tests."""
 
+import re
+
 import pytest
 
+# errorCode values and errorMsg fragments that all indicate bad .env images
+_SKIP_CODES = frozenset({"INVALID_INPUT", "OCR_PROCESSING_ERROR"})
+_SKIP_RE = re.compile(r"base64|improper|invalid|unexpected error|processing", re.IGNORECASE)
+
 
 @pytest.mark.stateless
 @pytest.mark.document_verification
-def test_verify_document_and_face(api_client, doc_verification_base_path, document_image_base64, document_image_rear_base64, face_image_base64):
+def test_verify_document_and_face(api_client, doc_verification_base_path, front_document_image, rear_document_image, facial_image):
     """
     Test POST /documentVerification/verifyDocumentsAndBiometrics.
     
@@ -14,18 +20,7 @@ def test_verify_document_and_face(api_client, doc_verification_base_path, docume
     """
     payload = {
         "documentsInfo": {
-            "documentImage": [
-                {
-                    "lightingScheme": 6,
-                    "image": document_image_base64,      # Front image
-                    "format": "JPG"
-                },
-                {
-                    "lightingScheme": 6,
-                    "image": document_image_rear_base64,  # Back image
-                    "format": "JPG"
-                }
-            ],
+            "documentImage": [front_document_image, rear_document_image],
             "documentPayload": {
                 "request": {
                     "vendor": "REGULA",
@@ -37,9 +32,7 @@ def test_verify_document_and_face(api_client, doc_verification_base_path, docume
             }
         },
         "biometricsInfo": {
-            "facialImage": {
-                "image": face_image_base64
-            }
+            "facialImage": facial_image
         },
         "processingInstructions": {
             "checkLiveness": True
@@ -56,16 +49,12 @@ def test_verify_document_and_face(api_client, doc_verification_base_path, docume
         try:
             error = response.json()
             error_code = error.get("errorCode", "")
-            error_msg = error.get("errorMsg", "").lower()
-            
-            # Skip on any of these - all indicate bad images
-            skip_codes = ["INVALID_INPUT", "OCR_PROCESSING_ERROR"]
-            skip_keywords = ["base64", "improper", "invalid", "unexpected error", "processing"]
-            
-            if error_code in skip_codes or any(keyword in error_msg for keyword in skip_keywords):
-                pytest.skip(f"Document or face image is not valid. Error: {error_code} - {error.get('errorMsg')}")
-        except:
-            pass
+            error_msg = error.get("errorMsg") or ""
+        except (ValueError, AttributeError):
+            error_code, error_msg = "", ""
+        
+        if error_code in _SKIP_CODES or _SKIP_RE.search(error_msg):
+            pytest.skip(f"Document or face image is not valid. Error: {error_code} - {error_msg}")
     
     assert response.status_code == 200, (
         f"Expected 200, got {response.status_code}. Response: {response.text}"
@@ -3,7 +3,11 @@ Shared fixtures for Face Liveness tests.
 """
 
 import pytest
-import json
+
+from autqa.utils.json_utils import loads
+
+# Fields every encrypted FACELIVENESSDATA payload must carry
+_LIVENESS_DATA_KEYS = frozenset({"key", "iv", "p"})
 
 
 @pytest.fixture
@@ -12,7 +16,7 @@ def face_liveness_base_path():
     return "/faceliveness"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def face_image_base64(env_store):
     """Get face image from .env file."""
     face_b64 = env_store.get("TX_DL_FACE_B64")
@@ -21,7 +25,7 @@ def face_image_base64(env_store):
     return face_b64
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def face_liveness_data(env_store):
     """
     Get face liveness encrypted data from .env file.
@@ -38,12 +42,13 @@ def face_liveness_data(env_store):
         pytest.skip("FACELIVENESSDATA not found in .env file")
     
     try:
-        data = json.loads(data_str)
-        assert "key" in data, "FACELIVENESSDATA must contain 'key'"
-        assert "iv" in data, "FACELIVENESSDATA must contain 'iv'"
-        assert "p" in data, "FACELIVENESSDATA must contain 'p'"
-        return data
-    except json.JSONDecodeError as e:
+        data = loads(data_str)
+    except ValueError as e:
         pytest.skip(f"FACELIVENESSDATA is not valid JSON: {e}")
-    except AssertionError as e:
-        pytest.skip(str(e))
+    
+    if not isinstance(data, dict):
+        pytest.skip("FACELIVENESSDATA must be a JSON object")
+    missing = _LIVENESS_DATA_KEYS - data.keys()
+    if missing:
+        pytest.skip(f"FACELIVENESSDATA must contain {sorted(missing)}")
+    return data
@@ -1,7 +1,15 @@
 """Negative tests for analyze endpoint."""
 
+import logging
+
 import pytest
 
+from autqa.utils.json_utils import response_json
+
+logger = logging.getLogger(__name__)
+
+_VALID_ERROR_CODES = frozenset({"INPUT_FORMAT_ERROR", "INPUT_VALUES_ERROR", "INTERNAL_SERVER_ERROR"})
+
 
 @pytest.mark.stateless
 @pytest.mark.face_liveness
@@ -14,14 +22,14 @@ def test_analyze_missing_payload(api_client, face_liveness_base_path):
     )
     
     try:
-        error = response.json()
+        error = response_json(response)
         assert "errorCode" in error
         assert "errorMsg" in error
         assert "status" in error
         assert "timestamp" in error
     except ValueError:
         assert response.text, "Response should contain error message"
-        print(f"Non-JSON error response: {response.text}")
+        logger.info("Non-JSON error response: %s", response.text)
 
 
 @pytest.mark.stateless
@@ -37,8 +45,8 @@ def test_analyze_missing_video_field(api_client, face_liveness_base_path):
     )
     
     try:
-        error = response.json()
-        assert error["errorCode"] in ["INPUT_FORMAT_ERROR", "INPUT_VALUES_ERROR", "INTERNAL_SERVER_ERROR"]
+        error = response_json(response)
+        assert error["errorCode"] in _VALID_ERROR_CODES
     except ValueError:
         assert response.text, "Response should contain error message"
 
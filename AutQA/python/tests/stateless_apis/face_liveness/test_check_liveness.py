@@ -1,7 +1,43 @@
 """Positive tests for checkLiveness endpoint (non-encrypted)."""
 
+import logging
+
 import pytest
 
+from autqa.utils.json_utils import response_json
+
+logger = logging.getLogger(__name__)
+
+# Frame timestamps from the Postman collection; one frame per timestamp
+_SINGLE_FRAME = (1581714134137,)
+_THREE_FRAMES = (1581714134137, 1581714134158, 1581714134189)
+
+
+def _frames(image_b64, timestamps):
+    """Build workflow_data frames that all reference the same base64 string."""
+    return [{"data": image_b64, "tags": [], "timestamp": ts} for ts in timestamps]
+
+
+_DEVICE_META_DATA = {
+    "username": "test_user",
+    "device_brand": "Apple",
+    "device_model": "iPhone 13",
+    "os_version": "iOS 15.0"
+}
+
+
+def _liveness_payload(image_b64, timestamps, workflow="charlie4", meta_data=None):
+    """Build a checkLiveness request body; only workflow, frames and meta_data vary."""
+    return {
+        "video": {
+            "meta_data": meta_data if meta_data is not None else {},
+            "workflow_data": {
+                "workflow": workflow,
+                "frames": _frames(image_b64, timestamps)
+            }
+        }
+    }
+
 
 @pytest.mark.stateless
 @pytest.mark.face_liveness
@@ -11,21 +47,7 @@ def test_check_liveness_with_single_frame(api_client, face_liveness_base_path, f
     
     Uses charlie4 workflow with one face image.
     """
-    payload = {
-        "video": {
-            "meta_data": {},
-            "workflow_data": {
-                "workflow": "charlie4",
-                "frames": [
-                    {
-                        "data": face_image_base64,
-                        "tags": [],
-                        "timestamp": 1581714134137
-                    }
-                ]
-            }
-        }
-    }
+    payload = _liveness_payload(face_image_base64, _SINGLE_FRAME)
     
     response = api_client.http_client.post(
         f"{face_liveness_base_path}/checkLiveness",
@@ -35,7 +57,7 @@ def test_check_liveness_with_single_frame(api_client, face_liveness_base_path, f
     # Skip if face image is invalid
     if response.status_code in [400, 500]:
         try:
-            error = response.json()
+            error = response_json(response)
             error_msg = error.get("errorMsg", "").lower()
             if "invalid" in error_msg or "image" in error_msg:
                 pytest.skip(f"Face image is invalid: {error.get('errorMsg')}")
@@ -46,7 +68,7 @@ def test_check_liveness_with_single_frame(api_client, face_liveness_base_path, f
         f"Expected 200, got {response.status_code}. Response: {response.text}"
     )
     
-    result = response.json()
+    result = response_json(response)
     
     # Verify response structure
     assert "video" in result, "Response should contain video"
@@ -56,9 +78,9 @@ def test_check_liveness_with_single_frame(api_client, face_liveness_base_path, f
     assert "liveness_score" in liveness, "Should have liveness_score"
     assert "result" in liveness, "Should have result"
     
-    print(f"\n? CheckLiveness successful!")
-    print(f"  Liveness Result: {liveness.get('result')}")
-    print(f"  Liveness Score: {liveness.get('liveness_score')}")
+    logger.info("? CheckLiveness successful!")
+    logger.info("  Liveness Result: %s", liveness.get('result'))
+    logger.info("  Liveness Score: %s", liveness.get('liveness_score'))
 
 
 @pytest.mark.stateless
@@ -70,31 +92,7 @@ def test_check_liveness_with_multiple_frames(api_client, face_liveness_base_path
     Uses charlie4 workflow with three frames (same image repeated).
     This simulates the format from your Postman collection.
     """
-    payload = {
-        "video": {
-            "meta_data": {},
-            "workflow_data": {
-                "workflow": "charlie4",
-                "frames": [
-                    {
-                        "data": face_image_base64,
-                        "tags": [],
-                        "timestamp": 1581714134137
-                    },
-                    {
-                        "data": face_image_base64,
-                        "tags": [],
-                        "timestamp": 1581714134158
-                    },
-                    {
-                        "data": face_image_base64,
-                        "tags": [],
-                        "timestamp": 1581714134189
-                    }
-                ]
-            }
-        }
-    }
+    payload = _liveness_payload(face_image_base64, _THREE_FRAMES)
     
     response = api_client.http_client.post(
         f"{face_liveness_base_path}/checkLiveness",
@@ -104,7 +102,7 @@ def test_check_liveness_with_multiple_frames(api_client, face_liveness_base_path
     # Skip if face image is invalid
     if response.status_code in [400, 500]:
         try:
-            error = response.json()
+            error = response_json(response)
             error_msg = error.get("errorMsg", "").lower()
             if "invalid" in error_msg or "image" in error_msg:
                 pytest.skip(f"Face image is invalid: {error.get('errorMsg')}")
@@ -115,7 +113,7 @@ def test_check_liveness_with_multiple_frames(api_client, face_liveness_base_path
         f"Expected 200, got {response.status_code}. Response: {response.text}"
     )
     
-    result = response.json()
+    result = response_json(response)
     
     # Verify response structure
     assert "video" in result
@@ -123,14 +121,14 @@ def test_check_liveness_with_multiple_frames(api_client, face_liveness_base_path
     
     liveness = result["video"]["liveness_result"]
     
-    print(f"\n? CheckLiveness with multiple frames successful!")
-    print(f"  Frames Processed: 3")
-    print(f"  Liveness Result: {liveness.get('result')}")
-    print(f"  Liveness Score: {liveness.get('liveness_score')}")
+    logger.info("? CheckLiveness with multiple frames successful!")
+    logger.info("  Frames Processed: %s", len(_THREE_FRAMES))
+    logger.info("  Liveness Result: %s", liveness.get('result'))
+    logger.info("  Liveness Score: %s", liveness.get('liveness_score'))
     
     # Check if frame details are in response
     if "frame_results" in liveness:
-        print(f"  Frame Results: {len(liveness['frame_results'])} frames")
+        logger.info("  Frame Results: %s frames", len(liveness['frame_results']))
 
 
 @pytest.mark.stateless
@@ -142,21 +140,7 @@ def test_check_liveness_with_different_workflows(api_client, face_liveness_base_
     
     Tests: charlie4, foxtrot, hotel workflows.
     """
-    payload = {
-        "video": {
-            "meta_data": {},
-            "workflow_data": {
-                "workflow": workflow,
-                "frames": [
-                    {
-                        "data": face_image_base64,
-                        "tags": [],
-                        "timestamp": 1581714134137
-                    }
-                ]
-            }
-        }
-    }
+    payload = _liveness_payload(face_image_base64, _SINGLE_FRAME, workflow=workflow)
     
     response = api_client.http_client.post(
         f"{face_liveness_base_path}/checkLiveness",
@@ -166,7 +150,7 @@ def test_check_liveness_with_different_workflows(api_client, face_liveness_base_
     # Skip if face image is invalid or workflow not supported
     if response.status_code in [400, 500]:
         try:
-            error = response.json()
+            error = response_json(response)
             error_msg = error.get("errorMsg", "").lower()
             error_code = error.get("errorCode", "")
             
@@ -184,16 +168,16 @@ def test_check_liveness_with_different_workflows(api_client, face_liveness_base_
         f"Expected 200, got {response.status_code}. Response: {response.text}"
     )
     
-    result = response.json()
+    result = response_json(response)
     
     assert "video" in result
     assert "liveness_result" in result["video"]
     
     liveness = result["video"]["liveness_result"]
     
-    print(f"\n? CheckLiveness with workflow '{workflow}' successful!")
-    print(f"  Liveness Result: {liveness.get('result')}")
-    print(f"  Liveness Score: {liveness.get('liveness_score')}")
+    logger.info("? CheckLiveness with workflow '%s' successful!", workflow)
+    logger.info("  Liveness Result: %s", liveness.get('result'))
+    logger.info("  Liveness Score: %s", liveness.get('liveness_score'))
 
 
 @pytest.mark.stateless
@@ -204,36 +188,7 @@ def test_check_liveness_with_metadata(api_client, face_liveness_base_path, face_
     
     Includes device and user metadata in the request.
     """
-    payload = {
-        "video": {
-            "meta_data": {
-                "username": "test_user",
-                "device_brand": "Apple",
-                "device_model": "iPhone 13",
-                "os_version": "iOS 15.0"
-            },
-            "workflow_data": {
-                "workflow": "charlie4",
-                "frames": [
-                    {
-                        "data": face_image_base64,
-                        "tags": [],
-                        "timestamp": 1581714134137
-                    },
-                    {
-                        "data": face_image_base64,
-                        "tags": [],
-                        "timestamp": 1581714134158
-                    },
-                    {
-                        "data": face_image_base64,
-                        "tags": [],
-                        "timestamp": 1581714134189
-                    }
-                ]
-            }
-        }
-    }
+    payload = _liveness_payload(face_image_base64, _THREE_FRAMES, meta_data=_DEVICE_META_DATA)
     
     response = api_client.http_client.post(
         f"{face_liveness_base_path}/checkLiveness",
@@ -243,7 +198,7 @@ def test_check_liveness_with_metadata(api_client, face_liveness_base_path, face_
     # Skip if face image is invalid
     if response.status_code in [400, 500]:
         try:
-            error = response.json()
+            error = response_json(response)
             error_msg = error.get("errorMsg", "").lower()
             if "invalid" in error_msg or "image" in error_msg:
                 pytest.skip(f"Face image is invalid: {error.get('errorMsg')}")
@@ -254,11 +209,11 @@ def test_check_liveness_with_metadata(api_client, face_liveness_base_path, face_
         f"Expected 200, got {response.status_code}. Response: {response.text}"
     )
     
-    result = response.json()
+    result = response_json(response)
     
     assert "video" in result
     assert "liveness_result" in result["video"]
     
-    print(f"\n? CheckLiveness with metadata successful!")
-    print(f"  User: {payload['video']['meta_data']['username']}")
-    print(f"  Device: {payload['video']['meta_data']['device_brand']} {payload['video']['meta_data']['device_model']}")
+    logger.info("? CheckLiveness with metadata successful!")
+    logger.info("  User: %s", payload['video']['meta_data']['username'])
+    logger.info("  Device: %s %s", payload['video']['meta_data']['device_brand'], payload['video']['meta_data']['device_model'])
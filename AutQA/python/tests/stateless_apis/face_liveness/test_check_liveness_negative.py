@@ -2,6 +2,8 @@
 
 import pytest
 
+from autqa.utils.json_utils import response_json
+
 
 @pytest.mark.stateless
 @pytest.mark.face_liveness
@@ -14,7 +16,7 @@ def test_check_liveness_missing_payload(api_client, face_liveness_base_path):
     )
     
     try:
-        error = response.json()
+        error = response_json(response)
         assert "errorCode" in error
         assert "errorMsg" in error
     except ValueError:
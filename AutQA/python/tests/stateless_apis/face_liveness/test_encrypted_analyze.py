@@ -1,7 +1,13 @@
 """Encrypted analyze endpoint tests."""
 
+import logging
+
 import pytest
 
+from autqa.utils.json_utils import response_json
+
+logger = logging.getLogger(__name__)
+
 
 @pytest.mark.stateless
 @pytest.mark.face_liveness
@@ -23,7 +29,7 @@ def test_analyze_encrypted_with_knomi_data(api_client, face_liveness_base_path,
         f"Expected 200, got {response.status_code}. Response: {response.text}"
     )
     
-    result = response.json()
+    result = response_json(response)
     
     assert "video" in result, "Response should contain video field"
     video = result["video"]
@@ -32,9 +38,9 @@ def test_analyze_encrypted_with_knomi_data(api_client, face_liveness_base_path,
     assert "liveness_result" in video, "Response should contain liveness_result"
     
     if "version" in result:
-        print(f"\n? Aware Face Liveness library version: {result['version']}")
+        logger.info("? Aware Face Liveness library version: %s", result['version'])
         assert isinstance(result["version"], str), "Version should be a string"
     
-    print(f"\n? Encrypted analyze successful!")
-    print(f"  Autocapture result: {video.get('autocapture_result')}")
-    print(f"  Liveness result: {video.get('liveness_result')}")
+    logger.info("? Encrypted analyze successful!")
+    logger.info("  Autocapture result: %s", video.get('autocapture_result'))
+    logger.info("  Liveness result: %s", video.get('liveness_result'))
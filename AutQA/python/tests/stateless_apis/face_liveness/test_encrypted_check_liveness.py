@@ -1,7 +1,13 @@
 """Encrypted checkLiveness endpoint tests."""
 
+import logging
+
 import pytest
 
+from autqa.utils.json_utils import response_json
+
+logger = logging.getLogger(__name__)
+
 
 @pytest.mark.stateless
 @pytest.mark.face_liveness
@@ -23,7 +29,7 @@ def test_check_liveness_encrypted_with_knomi_data(api_client, face_liveness_base
         f"Expected 200, got {response.status_code}. Response: {response.text}"
     )
     
-    result = response.json()
+    result = response_json(response)
     
     assert "video" in result, "Response should contain video field"
     video = result["video"]
@@ -31,10 +37,10 @@ def test_check_liveness_encrypted_with_knomi_data(api_client, face_liveness_base
     assert "liveness_result" in video, "Response should contain liveness_result"
     
     if "version" in result:
-        print(f"\n? Aware Face Liveness library version: {result['version']}")
+        logger.info("? Aware Face Liveness library version: %s", result['version'])
     
-    print(f"\n? Encrypted checkLiveness successful!")
-    print(f"  Liveness result: {video.get('liveness_result')}")
+    logger.info("? Encrypted checkLiveness successful!")
+    logger.info("  Liveness result: %s", video.get('liveness_result'))
 
 
 @pytest.mark.stateless
@@ -57,7 +63,7 @@ def test_check_active_liveness_encrypted_with_knomi_data(api_client, face_livene
         f"Expected 200, got {response.status_code}. Response: {response.text}"
     )
     
-    result = response.json()
+    result = response_json(response)
     
     assert "video" in result, "Response should contain video field"
     video = result["video"]
@@ -66,8 +72,8 @@ def test_check_active_liveness_encrypted_with_knomi_data(api_client, face_livene
     assert "liveness_result" in video, "Response should contain liveness_result"
     
     if "version" in result:
-        print(f"\n? Aware Face Liveness library version: {result['version']}")
+        logger.info("? Aware Face Liveness library version: %s", result['version'])
     
-    print(f"\n? Encrypted active liveness check successful!")
-    print(f"  Autocapture result: {video.get('autocapture_result')}")
-    print(f"  Liveness result: {video.get('liveness_result')}")
+    logger.info("? Encrypted active liveness check successful!")
+    logger.info("  Autocapture result: %s", video.get('autocapture_result'))
+    logger.info("  Liveness result: %s", video.get('liveness_result'))
@@ -1,7 +1,15 @@
 """Negative tests for encrypted endpoints."""
 
+import logging
+
 import pytest
 
+from autqa.utils.json_utils import response_json
+
+logger = logging.getLogger(__name__)
+
+_VALID_400_CODES = frozenset({"INPUT_FORMAT_ERROR", "INPUT_VALUES_ERROR"})
+
 
 @pytest.mark.stateless
 @pytest.mark.face_liveness
@@ -23,21 +31,21 @@ def test_analyze_encrypted_missing_key_field(api_client, face_liveness_base_path
     )
     
     try:
-        error = response.json()
+        error = response_json(response)
         
         if response.status_code == 400:
             assert "errorCode" in error
-            assert error["errorCode"] in ["INPUT_FORMAT_ERROR", "INPUT_VALUES_ERROR"]
-            print(f"\n? Proper 400 error returned")
-            print(f"  Error Code: {error['errorCode']}")
-            print(f"  Error Msg: {error['errorMsg']}")
+            assert error["errorCode"] in _VALID_400_CODES
+            logger.info("? Proper 400 error returned")
+            logger.info("  Error Code: %s", error['errorCode'])
+            logger.info("  Error Msg: %s", error['errorMsg'])
             
         elif response.status_code == 500:
             assert "errorCode" in error
             assert error["errorCode"] == "INTERNAL_SERVER_ERROR"
             
     except ValueError:
-        print(f"\n  Non-JSON error response: {response.text[:200]}")
+        logger.info("  Non-JSON error response: %s", response.text[:200])
 
 
 @pytest.mark.stateless
@@ -61,14 +69,14 @@ def test_analyze_encrypted_invalid_encryption_data(api_client, face_liveness_bas
     )
     
     try:
-        error = response.json()
+        error = response_json(response)
         assert "errorCode" in error
         assert "errorMsg" in error
-        print(f"\n? Proper error returned for invalid encryption")
-        print(f"  Error Code: {error['errorCode']}")
-        print(f"  Error Msg: {error['errorMsg']}")
+        logger.info("? Proper error returned for invalid encryption")
+        logger.info("  Error Code: %s", error['errorCode'])
+        logger.info("  Error Msg: %s", error['errorMsg'])
     except ValueError:
-        print(f"\n  Non-JSON error: {response.text[:200]}")
+        logger.info("  Non-JSON error: %s", response.text[:200])
 
 
 @pytest.mark.stateless
@@ -86,7 +94,7 @@ def test_analyze_encrypted_empty_payload(api_client, face_liveness_base_path):
     )
     
     try:
-        error = response.json()
+        error = response_json(response)
         assert "errorCode" in error
         assert "errorMsg" in error
         assert "status" in error
@@ -114,10 +122,10 @@ def test_encrypted_endpoints_require_all_three_fields(api_client, face_liveness_
     )
     
     try:
-        error = response.json()
+        error = response_json(response)
         assert "errorCode" in error
-        print(f"\n? Properly rejected payload missing '{missing_field}'")
-        print(f"  Error: {error.get('errorCode')} - {error.get('errorMsg', 'N/A')}")
+        logger.info("? Properly rejected payload missing '%s'", missing_field)
+        logger.info("  Error: %s - %s", error.get('errorCode'), error.get('errorMsg', 'N/A'))
     except ValueError:
         pass
 
@@ -135,7 +143,7 @@ def test_encrypted_error_codes_match_documentation(api_client, face_liveness_bas
     assert response.status_code in [400, 500]
     
     try:
-        error = response.json()
+        error = response_json(response)
         
         assert "errorCode" in error
         assert "errorMsg" in error
@@ -143,16 +151,15 @@ def test_encrypted_error_codes_match_documentation(api_client, face_liveness_bas
         assert "timestamp" in error
         
         if response.status_code == 400:
-            valid_400_codes = ["INPUT_FORMAT_ERROR", "INPUT_VALUES_ERROR"]
-            assert error["errorCode"] in valid_400_codes
-            print(f"\n? 400 error code validated: {error['errorCode']}")
+            assert error["errorCode"] in _VALID_400_CODES
+            logger.info("? 400 error code validated: %s", error['errorCode'])
             
         elif response.status_code == 500:
             assert error["errorCode"] == "INTERNAL_SERVER_ERROR"
-            print(f"\n? 500 error code validated: {error['errorCode']}")
+            logger.info("? 500 error code validated: %s", error['errorCode'])
         
-        print(f"  Full error: {error['errorMsg']}")
-        print(f"  Timestamp: {error['timestamp']}")
+        logger.info("  Full error: %s", error['errorMsg'])
+        logger.info("  Timestamp: %s", error['timestamp'])
         
     except ValueError as e:
         pytest.skip(f"Response is not JSON: {response.text[:100]}")
@@ -183,15 +190,15 @@ def test_regular_vs_encrypted_payload_formats(api_client, face_liveness_base_pat
     )
     
     try:
-        error = response.json()
+        error = response_json(response)
         assert "errorCode" in error
         
         if response.status_code == 400:
-            assert error["errorCode"] in ["INPUT_FORMAT_ERROR", "INPUT_VALUES_ERROR"]
+            assert error["errorCode"] in _VALID_400_CODES
         
-        print(f"\n? Encrypted endpoint properly rejected regular payload format")
-        print(f"  Error Code: {error['errorCode']}")
-        print(f"  Error Msg: {error.get('errorMsg', 'N/A')}")
+        logger.info("? Encrypted endpoint properly rejected regular payload format")
+        logger.info("  Error Code: %s", error['errorCode'])
+        logger.info("  Error Msg: %s", error.get('errorMsg', 'N/A'))
         
     except ValueError:
-        print(f"\n? Encrypted endpoint rejected regular payload (non-JSON error)")
+        logger.info("? Encrypted endpoint rejected regular payload (non-JSON error)")
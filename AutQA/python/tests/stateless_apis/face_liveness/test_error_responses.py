@@ -2,6 +2,10 @@
 
 import pytest
 
+from autqa.utils.json_utils import response_json
+
+_VALID_ERROR_CODES = frozenset({"INPUT_FORMAT_ERROR", "INPUT_VALUES_ERROR", "INTERNAL_SERVER_ERROR"})
+
 
 @pytest.mark.stateless
 @pytest.mark.face_liveness
@@ -10,7 +14,7 @@ def test_error_response_has_required_fields(api_client, face_liveness_base_path)
     response = api_client.http_client.post(f"{face_liveness_base_path}/analyze", json={})
     
     try:
-        error = response.json()
+        error = response_json(response)
         
         # Required fields
         assert "errorCode" in error, "Error must have errorCode"
@@ -25,9 +29,8 @@ def test_error_response_has_required_fields(api_client, face_liveness_base_path)
         assert isinstance(error["timestamp"], str), "timestamp must be string"
         
         # Validate error code values
-        valid_codes = ["INPUT_FORMAT_ERROR", "INPUT_VALUES_ERROR", "INTERNAL_SERVER_ERROR"]
-        assert error["errorCode"] in valid_codes, (
-            f"errorCode '{error['errorCode']}' not in valid codes: {valid_codes}"
+        assert error["errorCode"] in _VALID_ERROR_CODES, (
+            f"errorCode '{error['errorCode']}' not in valid codes: {sorted(_VALID_ERROR_CODES)}"
         )
     except ValueError:
         pytest.skip(f"Response is not JSON (got: {response.text[:100]}). Skipping JSON structure validation.")
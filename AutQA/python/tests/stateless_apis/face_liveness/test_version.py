@@ -1,7 +1,11 @@
 """Version endpoint tests."""
 
+import logging
+
 import pytest
 
+logger = logging.getLogger(__name__)
+
 
 @pytest.mark.stateless
 @pytest.mark.face_liveness
@@ -17,4 +21,4 @@ def test_get_face_liveness_version(api_client, face_liveness_base_path):
     assert version, "Version should not be empty"
     assert len(version) > 0, "Version should contain data"
     
-    print(f"? Face Liveness version: {version}")
+    logger.info("? Face Liveness version: %s", version)
@@ -2,12 +2,15 @@
 Shared fixtures for Face Matcher (Nexaface) tests.
 """
 
-import copy
-import time
+import contextvars
+
 import pytest
-import json
 import allure
 
+from client import get_session
+
+from autqa.utils.json_utils import dumps, loads, response_json
+
 
 SUPPORTED_ALGORITHMS = ["F200", "F500"]
 
@@ -18,9 +21,9 @@ def face_matcher_base_path():
     return "/nexaface"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def face_image_base64(env_store):
-    """Get face image from .env file (TEST)."""
+    """Get face image from .env file (TEST), read and stripped once per session."""
     face_b64 = env_store.get("TEST")
     if not face_b64:
         pytest.skip("TEST not found in .env file")
@@ -30,89 +33,63 @@ def face_image_base64(env_store):
     return face_b64
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def probe_face_image(face_image_base64):
     """Get probe face image - uses TEST."""
     return face_image_base64
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def gallery_face_image(face_image_base64):
     """Get gallery face image - uses TEST."""
     return face_image_base64
 
 
-@pytest.fixture(autouse=True)
-def log_api_responses(api_client):
-    """
-    Automatically log all API requests and responses.
+# Name of the face matcher test currently running; None between tests
+_CURRENT_TEST = contextvars.ContextVar("face_matcher_current_test", default=None)
 
-    This fixture runs for every test in this directory (autouse=True).
-    """
-    original_post = api_client.http_client.post
-    original_get = api_client.http_client.get
 
-    def logged_post(url, **kwargs):
-        print(f"\n{'='*80}")
-        print(f"[>>] POST {url}")
+def _log_response(response, *args, **kwargs):
+    """requests response hook: print and attach one request/response pair."""
+    test_name = _CURRENT_TEST.get()
+    if test_name is None:
+        return
+    # requests-cache's CachedSession runs response hooks a second time on
+    # uncached responses; log each response once
+    if getattr(response, "_autqa_logged", False):
+        return
+    response._autqa_logged = True
 
-        log_payload = None
-        if 'json' in kwargs:
-            log_payload = copy.deepcopy(kwargs['json'])
+    sent = response.request
+    url = sent.url
+    elapsed = response.elapsed.total_seconds()
+
+    print(f"\n{'='*80}")
+    print(f"[>>] {sent.method} {url}  ({test_name})")
+
+    if sent.body:
+        try:
+            # Parsed from the bytes already sent, so the caller's payload is untouched
+            log_payload = loads(sent.body)
+        except ValueError:
+            log_payload = None
+        if isinstance(log_payload, dict):
             # Truncate long base64 strings for readability
             for field in ('probe', 'gallery', 'encounter'):
                 if field in log_payload and 'VISIBLE_FRONTAL' in log_payload.get(field, {}):
                     img = log_payload[field]['VISIBLE_FRONTAL']
                     log_payload[field]['VISIBLE_FRONTAL'] = f"{img[:50]}... (truncated, length: {len(img)})"
 
+            request_text = dumps(log_payload, indent=True)
             print("[RQ] Request Body:")
-            print(json.dumps(log_payload, indent=2))
+            print(request_text)
             allure.attach(
-                json.dumps(log_payload, indent=2),
-                name=f"Request POST {url}",
+                request_text,
+                name=f"Request {sent.method} {url}",
                 attachment_type=allure.attachment_type.JSON,
             )
 
-        start = time.time()
-        response = original_post(url, **kwargs)
-        elapsed = time.time() - start
-
-        print(f"\n[RS] Response Status: {response.status_code}  [{elapsed:.3f}s]")
-        try:
-            response_data = response.json()
-            # Truncate long template exports for console only
-            log_response = copy.deepcopy(response_data)
-            if 'export' in log_response and len(log_response.get('export', '')) > 100:
-                log_response['export'] = (
-                    f"{log_response['export'][:50]}... "
-                    f"(truncated, length: {len(log_response['export'])})"
-                )
-            print("[RS] Response Body:")
-            print(json.dumps(log_response, indent=2))
-            allure.attach(
-                json.dumps(response_data, indent=2),
-                name=f"Response {response.status_code} [{elapsed:.3f}s]",
-                attachment_type=allure.attachment_type.JSON,
-            )
-        except Exception:
-            print(f"[RS] Response Text: {response.text[:500]}")
-            allure.attach(
-                response.text,
-                name=f"Response {response.status_code} [{elapsed:.3f}s] (text)",
-                attachment_type=allure.attachment_type.TEXT,
-            )
-
-        print(f"{'='*80}\n")
-        return response
-
-    def logged_get(url, **kwargs):
-        print(f"\n{'='*80}")
-        print(f"[>>] GET {url}")
-
-        start = time.time()
-        response = original_get(url, **kwargs)
-        elapsed = time.time() - start
-
+    if sent.method == "GET":
         print(f"[RS] Response Status: {response.status_code}  [{elapsed:.3f}s]")
         print(f"[RS] Response: {response.text}")
         allure.attach(
@@ -121,14 +98,64 @@ def log_api_responses(api_client):
             attachment_type=allure.attachment_type.TEXT,
         )
         print(f"{'='*80}\n")
+        return
+
+    print(f"\n[RS] Response Status: {response.status_code}  [{elapsed:.3f}s]")
+    try:
+        response_data = response_json(response)
+        # Tests call response.json() next; hand them this parse instead of a second one
+        response.json = lambda **kwargs: response_data
+        # Truncate long template exports for console only; a shallow copy
+        # is enough since only the top-level export value is replaced
+        log_response = response_data
+        export = response_data.get('export') if isinstance(response_data, dict) else None
+        if isinstance(export, str) and len(export) > 100:
+            log_response = {
+                **response_data,
+                'export': f"{export[:50]}... (truncated, length: {len(export)})",
+            }
+        print("[RS] Response Body:")
+        print(dumps(log_response, indent=True))
+        allure.attach(
+            dumps(response_data, indent=True),
+            name=f"Response {response.status_code} [{elapsed:.3f}s]",
+            attachment_type=allure.attachment_type.JSON,
+        )
+    except Exception:
+        print(f"[RS] Response Text: {response.text[:500]}")
+        allure.attach(
+            response.text,
+            name=f"Response {response.status_code} [{elapsed:.3f}s] (text)",
+            attachment_type=allure.attachment_type.TEXT,
+        )
 
-        return response
+    print(f"{'='*80}\n")
 
-    api_client.http_client.post = logged_post
-    api_client.http_client.get = logged_get
 
-    yield  # Test runs here
+@pytest.fixture(scope="package", autouse=True)
+def log_api_responses():
+    """
+    Automatically log all API requests and responses.
+
+    Installs one response hook on the shared requests session for the tests
+    in this directory instead of re-wrapping the client methods per test;
+    the hook is removed when the directory's tests finish.
+    """
+    hooks = get_session().hooks["response"]
+    # Never register twice, or every request would be logged twice
+    if _log_response in hooks:
+        yield
+        return
+    hooks.append(_log_response)
 
-    # Restore original methods after test
-    api_client.http_client.post = original_post
-    api_client.http_client.get = original_get
+    yield  # Tests run here
+
+    hooks.remove(_log_response)
+
+
+@pytest.fixture(autouse=True)
+def _current_test(log_api_responses, request):
+    """Point the session's logging hook at the running test; nothing is re-wrapped."""
+    token = _CURRENT_TEST.set(request.node.name)
+    yield
+    _CURRENT_TEST.reset(token)
@@ -0,0 +1,54 @@
+"""Response logging hook tests for Face Matcher."""
+
+import pytest
+import requests
+
+from . import conftest as face_matcher_conftest
+
+
+class _StubAdapter(requests.adapters.BaseAdapter):
+    """Transport adapter that answers every request with a fixed JSON body."""
+
+    def send(self, request, **kwargs):
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b'{"score": 1.0}'
+        response.headers["Content-Type"] = "application/json"
+        response.encoding = "utf-8"
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        return response
+
+    def close(self):
+        pass
+
+
+@pytest.mark.stateless
+@pytest.mark.face_matcher
+def test_log_response_attaches_once_per_call_under_cached_session(monkeypatch):
+    """
+    CachedSession re-runs response hooks on uncached responses; the logging
+    hook must still attach exactly one request/response pair per call.
+    """
+    requests_cache = pytest.importorskip("requests_cache")
+
+    attachments = []
+    monkeypatch.setattr(
+        face_matcher_conftest.allure, "attach",
+        lambda body, name=None, **kwargs: attachments.append(name),
+    )
+
+    session = requests_cache.CachedSession(backend="memory", allowable_methods=("GET",))
+    session.mount("http://stub/", _StubAdapter())
+    session.hooks["response"].append(face_matcher_conftest._log_response)
+    try:
+        for _ in range(2):
+            session.post(
+                "http://stub/nexaface/compare",
+                json={"probe": {"VISIBLE_FRONTAL": "abc"}},
+            )
+    finally:
+        session.close()
+
+    assert len(attachments) == 4, f"Expected one request/response pair per call, got {attachments}"
@@ -2,6 +2,8 @@
 
 import pytest
 
+_VALID_ERROR_CODES = frozenset({"INPUT_FORMAT_ERROR", "INPUT_VALUES_ERROR", "INTERNAL_SERVER_ERROR"})
+
 
 @pytest.mark.stateless
 @pytest.mark.knomi_web
@@ -27,7 +29,7 @@ def test_calculate_roi_missing_profile(api_client, preface_base_path):
     try:
         error = response.json()
         assert "errorCode" in error
-        assert error["errorCode"] in ["INPUT_FORMAT_ERROR", "INPUT_VALUES_ERROR", "INTERNAL_SERVER_ERROR"]
+        assert error["errorCode"] in _VALID_ERROR_CODES
         print(f"\n? Proper error for missing profile: {error['errorCode']}")
     except:
         pass